@@ -0,0 +1,60 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from .synthetic_corpus import page_payload
+
+class MockGuardianServer:
+    """
+    Local HTTP server that answers Guardian `/search` requests from an in-memory corpus,
+    with an injectable per-request latency to simulate network round-trips.
+    Usage:
+        with MockGuardianServer(results, latency=0.05) as server:
+            guardian_api.SEARCH_URL = server.url
+    """
+    def __init__(self, results, latency=0.0):
+        self.results = results
+        self.latency = latency
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/search"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query)
+                page = int(query.get('page', ['1'])[0])
+                page_size = int(query.get('page-size', ['10'])[0])
+                if server.latency:
+                    time.sleep(server.latency)
+                with server._lock:
+                    server.request_count += 1
+                body = json.dumps(page_payload(server.results, page, page_size)).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,156 @@
+"""
+Benchmark the extraction and analytics hot paths on synthetic Guardian corpora.
+
+    python -m benchmarks.run_benchmarks --sizes 10000 100000 1000000 --repeat 3
+
+Results are written to benchmarks/results/<timestamp>_<commit>.json and compared with the
+most recent earlier result file, flagging timings that got slower than --tolerance.
+"""
+import argparse
+import glob
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime
+from src.api_extarction import GuardianAPI, TokenBucket
+from src.transformation_analysis import DataProcessor
+from .synthetic_corpus import generate_results
+from .mock_server import MockGuardianServer
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+def time_call(function, repeat):
+    """
+    Run `function` `repeat` times.
+    Returns:
+        dict: The min, median and mean wall-clock time in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return {'min': min(timings), 'median': statistics.median(timings), 'mean': statistics.mean(timings), 'runs': repeat}
+
+def benchmark_analytics(size, repeat):
+    """
+    Time `results_to_dataframe`, every DataProcessor report and the unusual-event reports.
+    """
+    results = generate_results(size)
+    guardian_api = GuardianAPI()
+    timings = {'results_to_dataframe': time_call(lambda: guardian_api.results_to_dataframe(results), repeat)}
+
+    df = guardian_api.results_to_dataframe(results)
+    timings['DataProcessor.__init__'] = time_call(lambda: DataProcessor(df).close(), repeat)
+
+    processor = DataProcessor(df)
+    article_count, _ = processor.get_trudeau_articles_count()
+    unusual_dates = processor.get_unusual_events(article_count)['Date'].astype(str)
+    reports = {
+        'get_trudeau_articles_count': processor.get_trudeau_articles_count,
+        'get_article_counts_month': lambda: processor.get_article_counts('month'),
+        'get_top_section': processor.get_top_section,
+        'get_total_article_count': processor.get_total_article_count,
+        'get_unusual_events': lambda: processor.get_unusual_events(article_count),
+        'get_unusual_events_rolling': lambda: processor.get_unusual_events(article_count, detector='rolling'),
+        'get_articles_unusual_events': lambda: processor.get_articles_unusual_events(unusual_dates),
+        'get_unusual_event_details': lambda: processor.get_unusual_event_details(unusual_dates),
+    }
+    for name, report in reports.items():
+        timings[f"DataProcessor.{name}"] = time_call(report, repeat)
+    processor.close()
+    return timings
+
+def benchmark_extraction(size, latency, worker_counts, repeat):
+    """
+    Time `guardian_search` against a local mock server with `latency` seconds per request.
+    """
+    results = generate_results(size)
+    guardian_api = GuardianAPI(rate_limiter=TokenBucket(rate=1e9))
+    timings = {}
+    with MockGuardianServer(results, latency=latency) as server:
+        guardian_api.SEARCH_URL = server.url
+        for max_workers in worker_counts:
+            timings[f"guardian_search.workers_{max_workers}"] = time_call(
+                lambda: guardian_api.guardian_search("Justin Trudeau", "2018-01-01", "2024-12-31", max_workers=max_workers),
+                repeat)
+    return timings
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def save_results(benchmarks, output_dir=RESULTS_DIR):
+    """
+    Write a benchmark run to `output_dir`.
+    Returns:
+        str: The path of the result file.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    commit = git_commit()
+    run = {
+        'commit': commit,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'benchmarks': benchmarks,
+    }
+    path = os.path.join(output_dir, f"{datetime.now():%Y%m%d_%H%M%S}_{commit}.json")
+    with open(path, "w") as file:
+        json.dump(run, file, indent=2)
+    return path
+
+def compare_with_previous(path, tolerance=0.1):
+    """
+    Compare a result file with the most recent earlier one.
+    Returns:
+        list: (benchmark, previous median, current median) for every benchmark slower than
+            the previous run by more than `tolerance`.
+    """
+    earlier = sorted(p for p in glob.glob(os.path.join(os.path.dirname(path), "*.json")) if p < path)
+    if not earlier:
+        return []
+    with open(earlier[-1]) as file:
+        previous = json.load(file)['benchmarks']
+    with open(path) as file:
+        current = json.load(file)['benchmarks']
+
+    regressions = []
+    for name, timing in current.items():
+        if name in previous and timing['median'] > previous[name]['median'] * (1 + tolerance):
+            regressions.append((name, previous[name]['median'], timing['median']))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000], help="corpus sizes for the analytics benchmarks")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--extraction-size", type=int, default=2000, help="corpus size served by the mock server")
+    parser.add_argument("--latency", type=float, default=0.05, help="mock server latency per request, in seconds")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--output", default=RESULTS_DIR)
+    parser.add_argument("--tolerance", type=float, default=0.1, help="relative slowdown reported as a regression")
+    args = parser.parse_args(argv)
+
+    benchmarks = {}
+    for size in args.sizes:
+        for name, timing in benchmark_analytics(size, args.repeat).items():
+            benchmarks[f"{name}[{size}]"] = timing
+    for name, timing in benchmark_extraction(args.extraction_size, args.latency, args.workers, args.repeat).items():
+        benchmarks[f"{name}[{args.extraction_size}]"] = timing
+
+    for name, timing in benchmarks.items():
+        print(f"{name:<60} median {timing['median'] * 1000:10.2f} ms   min {timing['min'] * 1000:10.2f} ms")
+
+    path = save_results(benchmarks, args.output)
+    print(f"\nResults written to {path}")
+    for name, previous, current in compare_with_previous(path, args.tolerance):
+        print(f"REGRESSION {name}: {previous * 1000:.2f} ms -> {current * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import math
+import random
+from datetime import datetime, timedelta
+
+SECTIONS = [
+    ('world', 'World news', 'pillar/news', 'News'),
+    ('politics', 'Politics', 'pillar/news', 'News'),
+    ('business', 'Business', 'pillar/news', 'News'),
+    ('commentisfree', 'Opinion', 'pillar/opinion', 'Opinion'),
+    ('sport', 'Sport', 'pillar/sport', 'Sport'),
+    ('environment', 'Environment', 'pillar/news', 'News'),
+    ('us-news', 'US news', 'pillar/news', 'News'),
+    ('culture', 'Culture', 'pillar/arts', 'Arts'),
+]
+TYPES = ['article'] * 8 + ['liveblog', 'gallery']
+SUBJECTS = ['Justin Trudeau', 'Jagmeet Singh', 'Pierre Poilievre', 'Chrystia Freeland']
+WORDS = ['election', 'budget', 'climate', 'pipeline', 'visit', 'scandal', 'trade', 'vote', 'summit', 'protest']
+
+def generate_results(count, seed=0, from_date='2018-01-01', to_date='2024-12-31'):
+    """
+    Generate Guardian-shaped search results with realistic daily clustering.
+    Args:
+        count (int): Number of results to generate.
+        seed (int, optional): Random seed, so every run produces the same corpus. Defaults to 0.
+        from_date (str, optional): First publication date. Defaults to '2018-01-01'.
+        to_date (str, optional): Last publication date. Defaults to '2024-12-31'.
+    Returns:
+        list: Raw result dicts as returned in `response.results`.
+    """
+    rng = random.Random(seed)
+    start = datetime.strptime(from_date, "%Y-%m-%d")
+    span_seconds = int((datetime.strptime(to_date, "%Y-%m-%d") - start).total_seconds())
+    # a few news events attract bursts of coverage on top of the background rate
+    events = [rng.randrange(span_seconds) for _ in range(max(1, count // 2000))]
+
+    results = []
+    for index in range(count):
+        if rng.random() < 0.2:
+            offset = min(span_seconds, max(0, rng.choice(events) + int(rng.gauss(0, 86400))))
+        else:
+            offset = rng.randrange(span_seconds)
+        published = start + timedelta(seconds=offset)
+        section_id, section_name, pillar_id, pillar_name = rng.choice(SECTIONS)
+        subject = rng.choice(SUBJECTS)
+        title = f"{subject} {rng.choice(WORDS)} {rng.choice(WORDS)} {index}"
+        slug = title.lower().replace(' ', '-')
+        article_id = f"{section_id}/{published:%Y/%b/%d}/{slug}".lower()
+        results.append({
+            'id': article_id,
+            'type': rng.choice(TYPES),
+            'sectionId': section_id,
+            'sectionName': section_name,
+            'webPublicationDate': published.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            'webTitle': title,
+            'webUrl': f"https://www.theguardian.com/{article_id}",
+            'apiUrl': f"https://content.guardianapis.com/{article_id}",
+            'fields': {
+                'headline': title,
+                'byline': f"Reporter {rng.randrange(50)}",
+            },
+            'isHosted': False,
+            'pillarId': pillar_id,
+            'pillarName': pillar_name,
+        })
+    return results
+
+def page_payload(results, page, page_size=100):
+    """
+    Wrap one page of `results` in the Guardian search response envelope.
+    Returns:
+        dict: The response payload for `page`.
+    """
+    pages = max(1, math.ceil(len(results) / page_size))
+    start = (page - 1) * page_size
+    return {
+        'response': {
+            'status': 'ok',
+            'userTier': 'developer',
+            'total': len(results),
+            'startIndex': start + 1,
+            'pageSize': page_size,
+            'currentPage': page,
+            'pages': pages,
+            'orderBy': 'relevance',
+            'results': results[start:start + page_size],
+        }
+    }
@@ -1,2 +1,3 @@
 from . import utility
-from . import api_extarction
\ No newline at end of file
+from . import api_extarction
+from . import storage
\ No newline at end of file
@@ -1 +1,5 @@
-from .api_extraction import GuardianAPI
\ No newline at end of file
+from .api_extraction import GuardianAPI
+from .response_cache import ResponseCache, CacheMissError
+from .rate_limiter import TokenBucket, QuotaExhaustedError, backoff_delay, get_rate_limiter
+from .checkpoint import CrawlCheckpoint
+from .search_query import SearchQuery
\ No newline at end of file
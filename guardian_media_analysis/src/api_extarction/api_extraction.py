@@ -1,79 +1,479 @@
 import configparser
 import requests
-from datetime import datetime
+from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from datetime import datetime, timedelta
 import json
 import os
-from src.utility import setup_logger, fetch_config
+import re
+import threading
+from src.utility import setup_logger, fetch_config, split_date_range, bisect_date_range, merge_results, WatermarkStore, metrics, timed
+from src.storage.schema import normalize_results, CATEGORICAL_COLUMNS
+from .response_cache import CacheMissError
+from .rate_limiter import get_rate_limiter, backoff_delay
+from .checkpoint import CrawlCheckpoint
+from .search_query import SearchQuery
 import pandas as pd
 import time
 
 class GuardianAPI:
-    def __init__(self):
+    SEARCH_URL = 'http://content.guardianapis.com/search'
+
+    def __init__(self, cache=None, rate_limiter=None):
         self.config, self.config_path = fetch_config() 
         self.GUARDIAN_API_KEY = self.config.get('guardian_api2', 'api_key')
         self.logger = setup_logger(__name__)
         self.session = requests.Session()  
+        self._pool_size = DEFAULT_POOLSIZE
+        self._pool_lock = threading.Lock()
+        self.cache = cache
+        self.checkpoint_dir = os.path.join(os.path.dirname(self.config_path), 'checkpoints')
+        self.rate_limiter = rate_limiter if rate_limiter is not None else get_rate_limiter()
+
+    @timed('extraction')
+    def guardian_search(self, search_query, from_date, to_date, max_retries=3, max_workers=1, resumable=False):
+        """
+        Fetch every result page for a search query.
+        Args:
+            search_query (str or SearchQuery): The free-text query sent as `q`, or a SearchQuery
+                with server-side filters and field projection.
+            from_date (str): Start of the publication window (YYYY-MM-DD).
+            to_date (str): End of the publication window (YYYY-MM-DD).
+            max_retries (int, optional): Retries per page before giving up. Defaults to 3.
+            max_workers (int, optional): Maximum number of pages in flight once the page count
+                is known. Defaults to 1, which fetches pages sequentially.
+            resumable (bool, optional): Checkpoint every fetched page under `checkpoint_dir` so a
+                failed crawl can be rerun from where it stopped. Defaults to False.
+        Returns:
+            list: The raw result dicts, in page order.
+        """
+        checkpoint = self._checkpoint(search_query, from_date, to_date) if resumable else None
+        all_results = self._collect_pages(search_query, from_date, to_date, max_retries, max_workers, checkpoint)
+        if checkpoint is not None:
+            checkpoint.clear()
+
+        self.logger.info(f"Retrieved {len(all_results)} articles for search query: {search_query}")
+        return all_results
+
+    def _collect_pages(self, search_query, from_date, to_date, max_retries, max_workers, checkpoint):
+        """
+        Accumulate every page of a crawl, keeping the checkpoint on disk if the crawl fails.
+        """
+        if checkpoint is not None:
+            completed_pages = checkpoint.cursor()['completed_pages']
+            if completed_pages:
+                self.logger.info(f"Resuming crawl for '{search_query}' ({from_date} to {to_date}) with {len(completed_pages)} pages already fetched.")
 
-    def guardian_search(self, search_query, from_date, to_date, max_retries=3):
-        url = 'http://content.guardianapis.com/search'
-        params = {
-            'q': search_query.replace(' ', '%20'),
-            'from-date': from_date,
-            'to-date': to_date,
-            'page-size': 100,
-            'api-key': self.GUARDIAN_API_KEY,
-            'show-fields': 'headline,byline,sectionName,webPublicationDate'
-        }
         all_results = []
-        current_page = 1
-        total_pages = 1
+        try:
+            for results in self.iter_search_pages(search_query, from_date, to_date, max_retries, max_workers, checkpoint):
+                all_results.extend(results)
+        except Exception:
+            if checkpoint is not None:
+                self.logger.error(f"Crawl for '{search_query}' ({from_date} to {to_date}) failed. Fetched pages are kept in {checkpoint.path}; rerun to resume.")
+            raise
+        if checkpoint is not None:
+            # pages from different runs can overlap when articles move between pages
+            all_results = merge_results([all_results])
+        return all_results
+
+    def _checkpoint(self, search_query, from_date, to_date):
+        return CrawlCheckpoint(self.checkpoint_dir, search_query, from_date, to_date)
+
+    def iter_search_pages(self, search_query, from_date, to_date, max_retries=3, max_workers=1, checkpoint=None):
+        """
+        Stream the result pages of a search query as they arrive, in page order.
+        At most `max_workers` pages are in flight and at most twice that many are held
+        in memory waiting to be consumed.
+        Args:
+            search_query (str or SearchQuery): The free-text query sent as `q`, or a SearchQuery
+                with server-side filters and field projection.
+            from_date (str): Start of the publication window (YYYY-MM-DD).
+            to_date (str): End of the publication window (YYYY-MM-DD).
+            max_retries (int, optional): Retries per page before giving up. Defaults to 3.
+            max_workers (int, optional): Maximum number of pages in flight. Defaults to 1.
+            checkpoint (CrawlCheckpoint, optional): Serve pages already fetched by an earlier run
+                from disk and persist newly fetched ones. Defaults to None.
+        Yields:
+            list: The raw result dicts of one page.
+        """
+        url = self.SEARCH_URL
+        params = self._search_params(search_query, from_date, to_date)
+
+        if checkpoint is not None and checkpoint.cursor()['completed_pages']:
+            # page 1 is always re-fetched on resume to check that the stored pages still line up
+            data = self._fetch_page(url, params, 1, max_retries)
+            if not checkpoint.matches(data):
+                self.logger.warning(f"Search results for '{search_query}' changed since {checkpoint.path} was written. Discarding the checkpoint.")
+                checkpoint.clear()
+            checkpoint.save_page(1, data)
+        else:
+            data = self._fetch_resumable(url, params, 1, max_retries, checkpoint)
+        total_pages = data['response'].get('pages', 1)
+        result_count = len(data['response']['results'])
+        self.logger.info(f"Processed page 1/{total_pages}. Total results so far: {result_count}.")
+        yield data['response']['results']
+
+        if total_pages <= 1:
+            return
+
+        if max_workers > 1:
+            self._resize_connection_pool(max_workers)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pending = deque()
+                next_page = 2
+                for current_page in range(2, total_pages + 1):
+                    while next_page <= total_pages and len(pending) < 2 * max_workers:
+                        pending.append(executor.submit(self._fetch_resumable, url, params, next_page, max_retries, checkpoint))
+                        next_page += 1
+                    data = pending.popleft().result()
+                    result_count += len(data['response']['results'])
+                    self.logger.info(f"Processed page {current_page}/{total_pages}. Total results so far: {result_count}.")
+                    yield data['response']['results']
+        else:
+            for current_page in range(2, total_pages + 1):
+                data = self._fetch_resumable(url, params, current_page, max_retries, checkpoint)
+                result_count += len(data['response']['results'])
+                self.logger.info(f"Processed page {current_page}/{total_pages}. Total results so far: {result_count}.")
+                yield data['response']['results']
+
+    def iter_search_results(self, search_query, from_date, to_date, max_retries=3, max_workers=1):
+        """
+        Stream the individual result records of a search query, in page order.
+        Yields:
+            dict: One raw Guardian result.
+        """
+        for results in self.iter_search_pages(search_query, from_date, to_date, max_retries, max_workers):
+            yield from results
+
+    def guardian_search_sharded(self, search_query, from_date, to_date, window='month', max_workers=4,
+                                max_retries=3, max_results_per_window=2000, resumable=False):
+        """
+        Split a date range into windows, search the windows concurrently and merge the results.
+        Args:
+            search_query (str or SearchQuery): The free-text query sent as `q`, or a SearchQuery
+                with server-side filters and field projection.
+            from_date (str): Start of the publication window (YYYY-MM-DD).
+            to_date (str): End of the publication window (YYYY-MM-DD).
+            window (str, optional): 'month', 'week' or 'adaptive'. Adaptive windows start as months
+                and are halved until each holds at most `max_results_per_window` results. Defaults to 'month'.
+            max_workers (int, optional): Number of windows searched concurrently. Defaults to 4.
+            max_retries (int, optional): Retries per page before giving up. Defaults to 3.
+            max_results_per_window (int, optional): Result budget per adaptive window. Defaults to 2000.
+            resumable (bool, optional): Checkpoint every window, so a rerun after a failure only
+                fetches the pages and windows that are still missing. Defaults to False.
+        Returns:
+            list: The raw result dicts in window order, without duplicate article ids.
+        """
+        self._resize_connection_pool(max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            if window == 'adaptive':
+                windows = self._adaptive_windows(executor, search_query, split_date_range(from_date, to_date, 'month'),
+                                                 max_retries, max_results_per_window)
+            else:
+                windows = split_date_range(from_date, to_date, window)
+
+            self.logger.info(f"Searching '{search_query}' across {len(windows)} {window} windows with {max_workers} workers.")
+            checkpoints = [self._checkpoint(search_query, start, end) if resumable else None for start, end in windows]
+            window_results = executor.map(
+                lambda bounds, checkpoint: self._collect_pages(search_query, bounds[0], bounds[1], max_retries, 1, checkpoint),
+                windows, checkpoints)
+            all_results = merge_results(window_results)
+
+        for checkpoint in checkpoints:
+            if checkpoint is not None:
+                checkpoint.clear()
+
+        self.logger.info(f"Retrieved {len(all_results)} unique articles across {len(windows)} windows for search query: {search_query}")
+        return all_results
+
+    def batch_search(self, search_queries, from_date, to_date, max_workers=4, max_retries=3):
+        """
+        Search several queries at once through one bounded worker pool, so every query draws
+        from the same budget of in-flight requests.
+        Args:
+            search_queries (list): The free-text queries or SearchQuery objects, e.g. one per public figure.
+            from_date (str): Start of the publication window (YYYY-MM-DD).
+            to_date (str): End of the publication window (YYYY-MM-DD).
+            max_workers (int, optional): Maximum number of requests in flight across all queries. Defaults to 4.
+            max_retries (int, optional): Retries per page before giving up. Defaults to 3.
+        Returns:
+            dict: The raw result dicts of every query, in page order, keyed by query.
+        """
+        search_queries = list(dict.fromkeys(search_queries))
+        params = {query: self._search_params(query, from_date, to_date) for query in search_queries}
+        self._resize_connection_pool(max_workers)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            first_pages = {query: executor.submit(self._fetch_page, self.SEARCH_URL, params[query], 1, max_retries)
+                           for query in search_queries}
+            pages = {}
+            for query in search_queries:
+                total_pages = first_pages[query].result()['response'].get('pages', 1)
+                pages[query] = [first_pages[query]] + [
+                    executor.submit(self._fetch_page, self.SEARCH_URL, params[query], page, max_retries)
+                    for page in range(2, total_pages + 1)
+                ]
+
+            all_results = {}
+            for query in search_queries:
+                all_results[query] = [result for page in pages[query] for result in page.result()['response']['results']]
+                self.logger.info(f"Retrieved {len(all_results[query])} articles across {len(pages[query])} pages for search query: {query}")
+        return all_results
+
+    def batch_to_dataframe(self, batch_results, filter_results=True):
+        """
+        Combine the output of `batch_search` into one DataFrame tagged with a `query` column.
+        Args:
+            batch_results (dict): Raw results keyed by query.
+            filter_results (bool, optional): Keep only the articles whose title or headline
+                mentions their query text. SearchQuery results are not filtered again, as the
+                API already applied their query fields and filters. Defaults to True.
+        Returns:
+            pandas.DataFrame: The normalized articles of every query, or None when there are none.
+        """
+        frames = []
+        for query, results in batch_results.items():
+            filter_query = query if filter_results and not isinstance(query, SearchQuery) else None
+            df = self.results_to_dataframe(results, filter_query)
+            if df is not None:
+                frames.append(df.assign(query=str(query)))
+        if not frames:
+            self.logger.warning("No data was extracted for any query.")
+            return None
+
+        df = pd.concat(frames, ignore_index=True)
+        for column in ('query',) + CATEGORICAL_COLUMNS:
+            if column in df.columns:
+                df[column] = df[column].astype('category')
+        return df
+
+    def incremental_search(self, search_query, from_date, to_date, overlap_days=2, watermark_store=None, max_workers=1,
+                           article_store=None):
+        """
+        Fetch only the articles published since the last run and persist just those.
+        Args:
+            search_query (str or SearchQuery): The free-text query sent as `q`, or a SearchQuery
+                with server-side filters and field projection.
+            from_date (str): Start of the publication window used on the first run (YYYY-MM-DD).
+            to_date (str): End of the publication window (YYYY-MM-DD).
+            overlap_days (int, optional): Days re-requested before the high-water mark to pick up
+                late edits. Defaults to 2.
+            watermark_store (WatermarkStore, optional): Where marks and results are persisted.
+                Defaults to a store next to config.ini.
+            max_workers (int, optional): Passed through to `guardian_search`. Defaults to 1.
+            article_store (ArticleStore, optional): Upsert the fetched articles into this store,
+                tagged with the query, instead of appending a run file under `extracted/`.
+        Returns:
+            list: The newly fetched results. `watermark_store.load_results` or the article store
+                hold the full history.
+        """
+        if watermark_store is None:
+            watermark_store = WatermarkStore(os.path.dirname(self.config_path))
+        if not isinstance(search_query, SearchQuery):
+            search_query = SearchQuery(search_query)
+        state_key = search_query.state_key()
+        mark = watermark_store.get(state_key)
+        if mark is not None:
+            resume_date = datetime.strptime(mark['webPublicationDate'][:10], "%Y-%m-%d") - timedelta(days=overlap_days)
+            from_date = max(from_date, resume_date.strftime("%Y-%m-%d"))
+            self.logger.info(f"High-water mark for '{search_query}' is {mark['webPublicationDate']} ({mark['id']}). Requesting from {from_date}.")
+
+        new_results = self.guardian_search(search_query, from_date, to_date, max_workers=max_workers)
+        if article_store is not None:
+            article_store.upsert(new_results, query=str(search_query))
+        else:
+            watermark_store.append_results(state_key, new_results)
+        watermark_store.update(state_key, new_results)
+        self.logger.info(f"Stored {len(new_results)} newly fetched articles for search query: {search_query}")
+        return new_results
+
+    def _adaptive_windows(self, executor, search_query, windows, max_retries, max_results_per_window):
+        """
+        Halve date windows until a one-result probe reports at most `max_results_per_window`
+        results for each. The probes of every halving level run concurrently on `executor`.
+        Returns:
+            list: (from_date, to_date) tuples covering the windows, in date order.
+        """
+        adaptive_windows = []
+        pending = list(windows)
+        while pending:
+            probes = [executor.submit(self._probe_total, search_query, start, end, max_retries) for start, end in pending]
+            next_level = []
+            for (start, end), probe in zip(pending, probes):
+                halves = bisect_date_range(start, end)
+                if probe.result() <= max_results_per_window or halves is None:
+                    adaptive_windows.append((start, end))
+                else:
+                    next_level.extend(halves)
+            pending = next_level
+        return sorted(adaptive_windows)
+
+    def _probe_total(self, search_query, from_date, to_date, max_retries):
+        """
+        Fetch a one-result page to learn how many results a date window holds.
+        """
+        params = dict(self._search_params(search_query, from_date, to_date), **{'page-size': 1})
+        return self._fetch_page(self.SEARCH_URL, params, 1, max_retries)['response'].get('total', 0)
+
+    def _search_params(self, search_query, from_date, to_date):
+        if not isinstance(search_query, SearchQuery):
+            search_query = SearchQuery(search_query)
+        return dict(search_query.to_params(from_date, to_date), **{'api-key': self.GUARDIAN_API_KEY})
+
+    @staticmethod
+    def _filter_terms(filter_query):
+        """
+        Expand a Guardian query into its OR-alternatives, each a list of lower-cased terms that
+        must all appear in the title or headline. "Quoted phrases" and runs of bare words are
+        matched as phrases, AND and parentheses combine them, and NOT clauses are ignored.
+        Returns:
+            list: One list of terms per alternative.
+        """
+        tokens = deque(re.findall(r'"[^"]*"|\(|\)|[^\s()"]+', filter_query))
+        operators = ('AND', 'OR', 'NOT', '(', ')')
+
+        def parse_or():
+            alternatives = parse_and()
+            while tokens and tokens[0] == 'OR':
+                tokens.popleft()
+                alternatives = alternatives + parse_and()
+            return alternatives
+
+        def parse_and():
+            alternatives = [[]]
+            while tokens and tokens[0] not in ('OR', ')'):
+                token = tokens[0]
+                if token == 'AND':
+                    tokens.popleft()
+                elif token == 'NOT':
+                    tokens.popleft()
+                    parse_operand()
+                else:
+                    alternatives = [terms + operand for terms in alternatives for operand in parse_operand()]
+            return alternatives
+
+        def parse_operand():
+            if not tokens:
+                return [[]]
+            token = tokens.popleft()
+            if token == '(':
+                alternatives = parse_or()
+                if tokens and tokens[0] == ')':
+                    tokens.popleft()
+                return alternatives
+            if token.startswith('"'):
+                return [[token.strip('"').lower()]] if token.strip('"').strip() else [[]]
+            words = [token]
+            while tokens and tokens[0] not in operators and not tokens[0].startswith('"'):
+                words.append(tokens.popleft())
+            return [[' '.join(words).lower()]]
+
+        return [terms for terms in parse_or() if terms]
+
+    def _fetch_resumable(self, url, params, page, max_retries, checkpoint):
+        """
+        Fetch a page, serving it from the crawl checkpoint when an earlier run already fetched it.
+        """
+        if checkpoint is None:
+            return self._fetch_page(url, params, page, max_retries)
+
+        data = checkpoint.load_page(page)
+        if data is None:
+            data = self._fetch_page(url, params, page, max_retries)
+            checkpoint.save_page(page, data)
+        return data
+
+    def _fetch_page(self, url, params, page, max_retries):
+        """
+        Fetch a single result page through the shared rate limiter, retrying non-200 responses
+        with jittered exponential backoff (or the delay given by `Retry-After`).
+        Returns:
+            dict: The decoded JSON payload of the page.
+        """
+        page_params = dict(params, page=page)
+        if self.cache is not None:
+            cached = self.cache.get(url, page_params)
+            if cached is not None:
+                metrics.increment('cache_hits')
+                return cached
+            if self.cache.offline:
+                self.logger.error(f"Page {page} is not cached and the response cache is offline.")
+                raise CacheMissError(f"No cached response for page {page} while offline.")
+
         retry_count = 0
-        retry_delay = 5 
 
-        while current_page <= total_pages:
-            params['page'] = current_page
-            response = self.session.get(url, params=params)
-           
+        while True:
+            with metrics.timer('rate_limit_wait'):
+                self.rate_limiter.acquire()
+            started = time.perf_counter()
+            response = self.session.get(url, params=page_params)
+            metrics.observe('page_request', time.perf_counter() - started, status=response.status_code)
+            metrics.increment('bytes_downloaded', len(response.content))
+            self.rate_limiter.update_from_headers(response.headers)
+
             if response.status_code == 200:
                 data = response.json()
-                all_results.extend(data['response']['results'])
-                total_pages = data['response']['pages']
-                self.logger.info(f"Processed page {current_page}/{total_pages}. Total results so far: {len(all_results)}.")
-                current_page += 1
-                retry_count = 0 
-                retry_delay = 5  
-            else:
-                retry_count += 1
-                if retry_count <= max_retries:
-                    self.logger.warning(f"API request failed with status code {response.status_code}. Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                    retry_delay *= 2 
+                if self.cache is not None:
+                    self.cache.set(url, page_params, data)
+                return data
+
+            retry_count += 1
+            if retry_count <= max_retries:
+                retry_delay = backoff_delay(retry_count, retry_after=response.headers.get('Retry-After'))
+                metrics.increment('page_retries', status=response.status_code)
+                self.logger.warning(f"API request for page {page} failed with status code {response.status_code}. Retrying in {retry_delay:.1f} seconds...")
+                if response.status_code == 429:
+                    self.rate_limiter.pause(retry_delay)
                 else:
-                    self.logger.error(f"API request failed with status code {response.status_code} after {max_retries} retries.")
-                    raise Exception(f"API request failed with status code {response.status_code} after {max_retries} retries.")
+                    time.sleep(retry_delay)
+            else:
+                self.logger.error(f"API request for page {page} failed with status code {response.status_code} after {max_retries} retries.")
+                raise Exception(f"API request failed with status code {response.status_code} after {max_retries} retries.")
 
-        self.logger.info(f"Retrieved {len(all_results)} articles for search query: {search_query}")
-        return all_results
+    def _resize_connection_pool(self, max_workers):
+        """
+        Make sure the shared session keeps enough pooled connections for `max_workers` threads.
+        The pool only grows; the adapters it replaces are closed so their connections are released.
+        """
+        with self._pool_lock:
+            if max_workers <= self._pool_size:
+                return
+            previous = {self.session.get_adapter('http://'), self.session.get_adapter('https://')}
+            adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
+            self._pool_size = max_workers
+        for old_adapter in previous:
+            old_adapter.close()
         
+    @timed('extraction')
     def results_to_dataframe(self, results, filter_query=None):
         try:
+            df = normalize_results(results)
             if filter_query:
-                filtered_results = [
-                    result for result in results
-                    if filter_query.lower() in result.get('webTitle', '').lower()
-                    or filter_query.lower() in result.get('fields', {}).get('headline', '').lower()
-                ]
-                
-                df = pd.DataFrame(filtered_results)
+                texts = [df[column].fillna('').astype(str).str.lower() for column in ('webTitle', 'headline') if column in df.columns]
+                alternatives = self._filter_terms(filter_query)
+                matches = pd.Series(not alternatives, index=df.index)
+                for terms in alternatives:
+                    alternative = pd.Series(True, index=df.index)
+                    for term in terms:
+                        term_matches = pd.Series(False, index=df.index)
+                        for text in texts:
+                            term_matches |= text.str.contains(term, regex=False)
+                        alternative &= term_matches
+                    matches |= alternative
+                df = df[matches]
                 
                 if df.empty:
                     self.logger.warning(f"No data found for '{filter_query}'.")
                     return None
                 
+                df = df.reset_index(drop=True)
                 self.logger.info(f"Data filtered for '{filter_query}': {len(df)} rows")
                 return df
             else:
-                df = pd.DataFrame(results)
                 if df.empty:
                     self.logger.warning("No data was extracted from the API.")
                     return None
@@ -0,0 +1,94 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+from .search_query import SearchQuery
+
+class CrawlCheckpoint:
+    """
+    Persist the pages fetched for one crawl (query and date window) together with its cursor,
+    so a crawl interrupted by a failure can resume from the pages already on disk. The cursor
+    records a hash of the request parameters and the page layout the pages were fetched with,
+    so stale pages are not spliced into a crawl whose results have shifted since.
+    """
+    def __init__(self, checkpoint_dir, search_query, from_date, to_date):
+        if not isinstance(search_query, SearchQuery):
+            search_query = SearchQuery(search_query)
+        self.path = os.path.join(checkpoint_dir, f"{search_query.state_key()}_{from_date}_{to_date}")
+        self.cursor_path = os.path.join(self.path, "cursor.json")
+        self.search_query = str(search_query)
+        params = search_query.to_params(from_date, to_date)
+        self.params_hash = hashlib.sha256(json.dumps(params, sort_keys=True).encode('utf-8')).hexdigest()
+        self.from_date = from_date
+        self.to_date = to_date
+        self._lock = threading.Lock()
+
+    def cursor(self):
+        """
+        Read the crawl cursor.
+        Returns:
+            dict: The query, date window, parameter hash, total page and result counts, and
+                completed pages of the crawl.
+        """
+        if not os.path.exists(self.cursor_path):
+            return {'search_query': self.search_query, 'from_date': self.from_date, 'to_date': self.to_date,
+                    'params_hash': self.params_hash, 'total_pages': None, 'total_results': None,
+                    'completed_pages': []}
+        with open(self.cursor_path, "r") as file:
+            return json.load(file)
+
+    def matches(self, data):
+        """
+        Check that the stored pages belong to the same crawl as a freshly fetched first page.
+        Args:
+            data (dict): The payload of page 1 fetched by the current run.
+        Returns:
+            bool: False when the request parameters, page count or result count changed.
+        """
+        cursor = self.cursor()
+        return (cursor.get('params_hash') == self.params_hash
+                and cursor.get('total_pages') == data['response'].get('pages', 1)
+                and cursor.get('total_results') == data['response'].get('total'))
+
+    def load_page(self, page):
+        """
+        Load a previously fetched page.
+        Returns:
+            dict: The page payload, or None when the page was not fetched yet.
+        """
+        path = self._page_path(page)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r") as file:
+            return json.load(file)
+
+    def save_page(self, page, data):
+        """
+        Persist a fetched page and record it in the cursor.
+        """
+        self._write_json(self._page_path(page), data)
+        with self._lock:
+            cursor = self.cursor()
+            cursor['params_hash'] = self.params_hash
+            cursor['total_pages'] = data['response'].get('pages', 1)
+            cursor['total_results'] = data['response'].get('total')
+            cursor['completed_pages'] = sorted(set(cursor['completed_pages']) | {page})
+            self._write_json(self.cursor_path, cursor)
+
+    def clear(self):
+        """
+        Remove the checkpoint once the crawl has completed.
+        """
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def _page_path(self, page):
+        return os.path.join(self.path, f"page-{page:05d}.json")
+
+    @staticmethod
+    def _write_json(path, payload):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as file:
+            json.dump(payload, file)
+        os.replace(tmp_path, path)
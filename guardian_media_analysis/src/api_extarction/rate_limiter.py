@@ -0,0 +1,132 @@
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+
+class QuotaExhaustedError(Exception):
+    """Raised when the API reported that the daily request quota is used up."""
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter shared by every fetch in the process.
+    Workers call `acquire` before each request, feed the response headers back through
+    `update_from_headers`, and call `pause` when the API asks them to back off, so all
+    workers slow down together instead of retrying into the limit one by one.
+    A cross-process limiter only needs to provide the same three methods.
+    """
+    def __init__(self, rate=12.0, capacity=None):
+        """
+        Args:
+            rate (float, optional): Requests allowed per second. Defaults to 12, the Guardian
+                developer-key limit.
+            capacity (float, optional): Largest burst allowed. Defaults to `rate`.
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._day_exhausted_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Block until a request may be sent.
+        Raises:
+            QuotaExhaustedError: The daily quota is used up until the next UTC day.
+        """
+        while True:
+            with self._lock:
+                if time.time() < self._day_exhausted_until:
+                    reset = datetime.fromtimestamp(self._day_exhausted_until, timezone.utc)
+                    raise QuotaExhaustedError(f"The daily API quota is exhausted until {reset:%Y-%m-%d %H:%M} UTC.")
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(self._paused_until - now, (1 - self._tokens) / self.rate)
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        """
+        Hold back every worker for `seconds`, e.g. after a 429 response.
+        """
+        with self._lock:
+            self._pause(seconds)
+
+    def _pause(self, seconds):
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0
+
+    def update_from_headers(self, headers):
+        """
+        Adapt to the quota reported by the API's X-RateLimit-* response headers.
+        The per-minute limit sets the refill rate. An exhausted per-minute quota pauses every
+        worker until the next minute starts; an exhausted per-day quota makes `acquire` raise
+        QuotaExhaustedError until the next UTC day.
+        """
+        limit_minute = _int_header(headers, 'X-RateLimit-Limit-minute')
+        remaining_minute = _int_header(headers, 'X-RateLimit-Remaining-minute')
+        remaining_day = _int_header(headers, 'X-RateLimit-Remaining-day')
+
+        with self._lock:
+            if limit_minute:
+                self.rate = limit_minute / 60.0
+                self.capacity = max(1.0, min(self.capacity, float(limit_minute)))
+            if remaining_minute is not None:
+                self._tokens = min(self._tokens, float(remaining_minute))
+            if remaining_minute == 0:
+                # quota windows are aligned to the wall clock
+                self._pause(60 - time.time() % 60)
+            if remaining_day == 0:
+                tomorrow = datetime.now(timezone.utc).date() + timedelta(days=1)
+                self._day_exhausted_until = datetime(tomorrow.year, tomorrow.month, tomorrow.day, tzinfo=timezone.utc).timestamp()
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+
+def backoff_delay(attempt, base_delay=5, max_delay=300, retry_after=None):
+    """
+    Compute how long to wait before retry number `attempt` (starting at 1).
+    A `Retry-After` header value (seconds or HTTP date) wins; otherwise the delay grows
+    exponentially from `base_delay` with equal jitter so concurrent workers spread out.
+    Returns:
+        float: The delay in seconds.
+    """
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                return max(0.0, (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds())
+            except (TypeError, ValueError):
+                pass
+
+    delay = min(max_delay, base_delay * 2 ** (attempt - 1))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def _int_header(headers, name):
+    value = headers.get(name)
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+_default_rate_limiter = None
+_default_lock = threading.Lock()
+
+def get_rate_limiter():
+    """
+    Return the process-wide rate limiter shared by every GuardianAPI instance.
+    """
+    global _default_rate_limiter
+    with _default_lock:
+        if _default_rate_limiter is None:
+            _default_rate_limiter = TokenBucket()
+        return _default_rate_limiter
@@ -0,0 +1,127 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from src.utility import fetch_config
+
+class CacheMissError(Exception):
+    """Raised in offline mode when a request is not in the response cache."""
+
+class ResponseCache:
+    """
+    On-disk cache of decoded Guardian API responses, addressed by a hash of the request URL
+    and parameters (with the API key removed), with a TTL and size-bounded LRU eviction.
+    """
+    IGNORED_PARAMS = ('api-key',)
+
+    def __init__(self, cache_dir=None, ttl=24 * 60 * 60, max_bytes=512 * 1024 * 1024, offline=False):
+        """
+        Args:
+            cache_dir (str, optional): Directory holding cached responses. Defaults to `cache/`
+                next to config.ini.
+            ttl (int, optional): Seconds a response stays fresh; None disables expiry. Defaults to one day.
+            max_bytes (int, optional): Size budget of the cache directory. Defaults to 512 MB.
+            offline (bool, optional): Serve only from the cache and never hit the network. Offline,
+                entries are served whatever their age and are never evicted. Defaults to False.
+        """
+        if cache_dir is None:
+            _, config_path = fetch_config()
+            cache_dir = os.path.join(os.path.dirname(config_path), "cache")
+        os.makedirs(cache_dir, exist_ok=True)
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self._lock = threading.Lock()
+        self._size = None
+
+    def key(self, url, params):
+        """
+        Compute the content address of a request.
+        Returns:
+            str: The hex digest identifying the request.
+        """
+        cacheable = {name: value for name, value in params.items() if name not in self.IGNORED_PARAMS}
+        request = json.dumps({'url': url, 'params': cacheable}, sort_keys=True, default=str)
+        return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+    def get(self, url, params):
+        """
+        Look up a cached response.
+        Returns:
+            dict: The cached payload, or None when missing or, outside offline mode, expired.
+        """
+        path = self._path(self.key(url, params))
+        try:
+            with open(path, "r") as file:
+                entry = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        if not self.offline and self.ttl is not None and time.time() - entry['stored_at'] > self.ttl:
+            self._remove(path)
+            return None
+
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return entry['payload']
+
+    def set(self, url, params, payload):
+        """
+        Store a response payload and evict the least recently used entries beyond `max_bytes`.
+        """
+        path = self._path(self.key(url, params))
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as file:
+            json.dump({'stored_at': time.time(), 'url': url, 'payload': payload}, file)
+        size = os.path.getsize(tmp_path)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._entries())
+            else:
+                self._size += size
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def clear(self):
+        for path, _, _ in self._entries():
+            self._remove(path)
+        self._size = 0
+
+    def _evict(self):
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        self._size = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if self._size <= self.max_bytes:
+                break
+            self._remove(path)
+            self._size -= size
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
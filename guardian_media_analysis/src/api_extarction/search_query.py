@@ -0,0 +1,123 @@
+import hashlib
+import json
+import re
+
+class SearchQuery:
+    """
+    Builder for Guardian content-search parameters, so filtering and column projection happen
+    server-side instead of after the pages are downloaded. Queries are immutable: every builder
+    method returns a new query, so they are safe to use as dict keys.
+    Example:
+        SearchQuery('"Justin Trudeau"').in_fields('headline').in_section('world', 'politics').ordered_by('newest')
+    """
+    DEFAULT_SHOW_FIELDS = ('headline', 'byline', 'sectionName', 'webPublicationDate')
+    ORDER_BY_VALUES = ('newest', 'oldest', 'relevance')
+
+    def __init__(self, q=None, query_fields=None, sections=None, tags=None, order_by=None,
+                 show_fields=DEFAULT_SHOW_FIELDS, page_size=100):
+        """
+        Args:
+            q (str, optional): Free-text query; supports AND/OR/NOT and "quoted phrases".
+            query_fields (list, optional): Fields `q` is matched against, e.g. ['headline'].
+            sections (list, optional): Section ids, any of which may match, e.g. ['world', 'politics'].
+            tags (list, optional): Tag ids that must all match, e.g. ['world/canada'].
+            order_by (str, optional): 'newest', 'oldest' or 'relevance'.
+            show_fields (list, optional): Fields returned in each result's `fields` dict.
+                Defaults to headline, byline, sectionName and webPublicationDate.
+            page_size (int, optional): Results per page, at most 200. Defaults to 100.
+        """
+        if order_by is not None and order_by not in self.ORDER_BY_VALUES:
+            raise ValueError(f"Invalid order_by value. Allowed values are {', '.join(self.ORDER_BY_VALUES)}.")
+        self.q = q
+        self.query_fields = tuple(query_fields or ())
+        self.sections = tuple(sections or ())
+        self.tags = tuple(tags or ())
+        self.order_by = order_by
+        self.show_fields = tuple(show_fields or ())
+        self.page_size = page_size
+
+    def _replace(self, **changes):
+        options = dict(q=self.q, query_fields=self.query_fields, sections=self.sections, tags=self.tags,
+                       order_by=self.order_by, show_fields=self.show_fields, page_size=self.page_size)
+        options.update(changes)
+        return SearchQuery(**options)
+
+    def in_fields(self, *fields):
+        return self._replace(query_fields=self.query_fields + fields)
+
+    def in_section(self, *sections):
+        return self._replace(sections=self.sections + sections)
+
+    def with_tag(self, *tags):
+        return self._replace(tags=self.tags + tags)
+
+    def ordered_by(self, order_by):
+        return self._replace(order_by=order_by)
+
+    def with_fields(self, *fields):
+        """
+        Replace the fields returned with each result (`show-fields`).
+        """
+        return self._replace(show_fields=fields)
+
+    def to_params(self, from_date, to_date):
+        """
+        Build the request parameters, without the API key and page number.
+        Returns:
+            dict: The search parameters.
+        """
+        params = {'from-date': from_date, 'to-date': to_date, 'page-size': self.page_size}
+        if self.q:
+            params['q'] = self.q
+        if self.query_fields:
+            params['query-fields'] = ','.join(self.query_fields)
+        if self.sections:
+            params['section'] = '|'.join(self.sections)
+        if self.tags:
+            params['tag'] = ','.join(self.tags)
+        if self.order_by:
+            params['order-by'] = self.order_by
+        if self.show_fields:
+            params['show-fields'] = ','.join(self.show_fields)
+        return params
+
+    def fingerprint(self):
+        """
+        A stable hash of the request parameters other than the date window.
+        Returns:
+            str: 16 hex digits that differ whenever any parameter sent to the API differs.
+        """
+        params = self.to_params(None, None)
+        del params['from-date'], params['to-date']
+        return hashlib.sha256(json.dumps(params, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+    def state_key(self):
+        """
+        The key crawl checkpoints, watermarks and stored results are kept under: a readable
+        slug of the query text followed by its parameter fingerprint.
+        """
+        slug = re.sub(r"[^a-z0-9]+", "_", (self.q or '').lower()).strip("_")
+        return f"{slug}_{self.fingerprint()}" if slug else self.fingerprint()
+
+    def _key(self):
+        return (self.q, self.query_fields, self.sections, self.tags, self.order_by, self.show_fields, self.page_size)
+
+    def __eq__(self, other):
+        return isinstance(other, SearchQuery) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __str__(self):
+        filters = [f"{name}={value}" for name, value in (
+            ('query-fields', ','.join(self.query_fields)),
+            ('section', '|'.join(self.sections)),
+            ('tag', ','.join(self.tags)),
+            ('order-by', self.order_by),
+            ('show-fields', ','.join(self.show_fields) if self.show_fields != self.DEFAULT_SHOW_FIELDS else ''),
+            ('page-size', str(self.page_size) if self.page_size != 100 else ''),
+        ) if value]
+        return f"{self.q or ''} [{', '.join(filters)}]" if filters else (self.q or '')
+
+    def __repr__(self):
+        return f"SearchQuery({str(self)!r})"
@@ -0,0 +1,3 @@
+from .schema import ARTICLE_COLUMNS, CATEGORICAL_COLUMNS, flatten_records, normalize_results
+from .batch_writer import ParquetBatchWriter
+from .article_store import ArticleStore
\ No newline at end of file
@@ -0,0 +1,184 @@
+import os
+import duckdb
+import pandas as pd
+from src.utility import setup_logger, fetch_config
+from .schema import ARTICLE_COLUMNS, flatten_records, typed_select, sql_literal
+
+class ArticleStore:
+    """
+    Persistent DuckDB store of extracted articles, upserted on article `id`, with export to
+    Parquet partitioned by publication year and month. A `daily_counts` rollup of articles per
+    day, section and type is refreshed for the affected days on every upsert.
+    """
+    def __init__(self, db_path=None, read_only=False):
+        """
+        Args:
+            db_path (str, optional): Path of the DuckDB database file. Defaults to
+                `guardian_articles.duckdb` next to config.ini.
+            read_only (bool, optional): Open the database without write access. Defaults to False.
+        """
+        if db_path is None:
+            _, config_path = fetch_config()
+            db_path = os.path.join(os.path.dirname(config_path), "guardian_articles.duckdb")
+        self.db_path = db_path
+        self.logger = setup_logger(__name__)
+        self.con = duckdb.connect(db_path, read_only=read_only)
+        if not read_only:
+            self._create_tables()
+
+    def upsert(self, records, query=None):
+        """
+        Insert articles, replacing any stored article with the same `id`.
+        Args:
+            records (list or pandas.DataFrame): Raw Guardian result dicts, or a DataFrame with
+                article columns.
+            query (str, optional): The search query the articles were extracted for. A DataFrame
+                with a `query` column is tagged row by row instead. Tagged articles are exposed
+                per query through the `query_articles` view.
+        Returns:
+            int: The number of articles written.
+        """
+        tags = None
+        if isinstance(records, pd.DataFrame) and query is None and 'query' in records.columns:
+            tags = records[['query', 'id']].astype(str).drop_duplicates()
+        if isinstance(records, pd.DataFrame) and 'fields' in records.columns:
+            batch = flatten_records(records.to_dict('records'))
+        elif isinstance(records, pd.DataFrame):
+            batch = records.reindex(columns=list(ARTICLE_COLUMNS))
+        else:
+            batch = flatten_records(records)
+        batch = batch.dropna(subset=['id']).drop_duplicates(subset='id', keep='last')
+        if batch.empty:
+            return 0
+
+        self.con.register('batch', batch)
+        self.con.execute("BEGIN TRANSACTION")
+        try:
+            self.con.execute(f"CREATE OR REPLACE TEMP TABLE staged_articles AS {typed_select('batch')}")
+            self.con.execute("""
+                CREATE OR REPLACE TEMP TABLE affected_days AS
+                SELECT webPublicationDate::date AS day FROM staged_articles
+                UNION
+                SELECT a.webPublicationDate::date FROM articles a JOIN staged_articles s USING (id)
+            """)
+            self.con.execute("INSERT OR REPLACE INTO articles SELECT * FROM staged_articles")
+            self._refresh_rollup("SELECT day FROM affected_days")
+            self.con.execute("COMMIT")
+        except Exception:
+            self.con.execute("ROLLBACK")
+            raise
+        if query is not None:
+            self.con.execute("INSERT OR IGNORE INTO article_queries SELECT ?, id FROM batch", [query])
+        if tags is not None:
+            self.con.register('tags', tags)
+            self.con.execute("INSERT OR IGNORE INTO article_queries SELECT query, id FROM tags")
+            self.con.unregister('tags')
+        self.con.unregister('batch')
+        self.logger.info(f"Upserted {len(batch)} articles into {self.db_path}.")
+        return len(batch)
+
+    def rebuild_rollup(self):
+        """
+        Recompute the `daily_counts` rollup from every stored article.
+        """
+        self.con.execute("BEGIN TRANSACTION")
+        try:
+            self.con.execute("DELETE FROM daily_counts")
+            self._refresh_rollup(None)
+            self.con.execute("COMMIT")
+        except Exception:
+            self.con.execute("ROLLBACK")
+            raise
+
+    def _refresh_rollup(self, days_query):
+        """
+        Recount the articles of the days returned by `days_query` (every day when None).
+        """
+        day_filter = f"WHERE webPublicationDate::date IN ({days_query})" if days_query else ""
+        if days_query:
+            self.con.execute(f"DELETE FROM daily_counts WHERE day IN ({days_query})")
+        self.con.execute(f"""
+            INSERT INTO daily_counts
+            SELECT webPublicationDate::date AS day, sectionName, type, count(*) AS article_count
+            FROM articles
+            {day_filter}
+            GROUP BY 1, 2, 3
+        """)
+
+    def query(self, query, params=None):
+        """
+        Run a SQL query against the store.
+        Returns:
+            pandas.DataFrame: The query result.
+        """
+        return self.con.execute(query, params).fetchdf()
+
+    def to_dataframe(self):
+        """
+        Load every stored article.
+        Returns:
+            pandas.DataFrame: The stored articles ordered by publication date.
+        """
+        return self.query("SELECT * FROM articles ORDER BY webPublicationDate")
+
+    def count(self):
+        return self.con.execute("SELECT count(*) FROM articles").fetchone()[0]
+
+    def export_parquet(self, output_dir):
+        """
+        Write the stored articles to Parquet under `output_dir/year=YYYY/month=M/`.
+        Args:
+            output_dir (str): The root directory of the partitioned dataset.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        self.con.execute(f"""
+            COPY (
+                SELECT *, year(webPublicationDate) AS year, month(webPublicationDate) AS month
+                FROM articles
+            ) TO '{sql_literal(output_dir)}' (FORMAT PARQUET, PARTITION_BY (year, month), OVERWRITE_OR_IGNORE)
+        """)
+        self.logger.info(f"Exported {self.count()} articles to {output_dir}.")
+
+    def close(self):
+        self.con.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _create_tables(self):
+        columns = ",\n                ".join(f'"{name}" {sql_type}' for name, sql_type in ARTICLE_COLUMNS.items())
+        self.con.execute(f"""
+            CREATE TABLE IF NOT EXISTS articles (
+                {columns},
+                PRIMARY KEY (id)
+            )
+        """)
+        rollup_exists = self.con.execute(
+            "SELECT count(*) FROM information_schema.tables WHERE table_name = 'daily_counts'"
+        ).fetchone()[0]
+        self.con.execute("""
+            CREATE TABLE IF NOT EXISTS daily_counts (
+                day DATE,
+                sectionName VARCHAR,
+                type VARCHAR,
+                article_count BIGINT
+            )
+        """)
+        if not rollup_exists:
+            self.rebuild_rollup()
+        self.con.execute("""
+            CREATE TABLE IF NOT EXISTS article_queries (
+                query VARCHAR,
+                id VARCHAR,
+                PRIMARY KEY (query, id)
+            )
+        """)
+        self.con.execute("""
+            CREATE VIEW IF NOT EXISTS query_articles AS
+            SELECT q.query, a.*
+            FROM article_queries q
+            JOIN articles a USING (id)
+        """)
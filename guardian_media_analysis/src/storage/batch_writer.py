@@ -0,0 +1,56 @@
+import os
+import duckdb
+from src.utility import setup_logger
+from .schema import flatten_records, typed_select, sql_literal
+
+class ParquetBatchWriter:
+    """
+    Flush streamed Guardian results into a directory of Parquet part files, one per batch,
+    so memory stays bounded by `batch_size` and the data can be queried while the crawl runs
+    (e.g. `SELECT * FROM read_parquet('<output_dir>/*.parquet')`).
+    """
+    def __init__(self, output_dir, batch_size=1000):
+        os.makedirs(output_dir, exist_ok=True)
+        self.output_dir = output_dir
+        self.batch_size = batch_size
+        self.logger = setup_logger(__name__)
+        self.con = duckdb.connect()
+        self._buffer = []
+        self._part = len([name for name in os.listdir(output_dir) if name.endswith(".parquet")])
+        self.rows_written = 0
+
+    def write(self, records):
+        """
+        Buffer a batch of raw results, flushing whenever `batch_size` records are buffered.
+        Args:
+            records (iterable): Raw Guardian result dicts, e.g. one page from `iter_search_pages`.
+        """
+        self._buffer.extend(records)
+        while len(self._buffer) >= self.batch_size:
+            batch, self._buffer = self._buffer[:self.batch_size], self._buffer[self.batch_size:]
+            self._write_part(batch)
+
+    def flush(self):
+        if self._buffer:
+            self._write_part(self._buffer)
+            self._buffer = []
+
+    def close(self):
+        self.flush()
+        self.con.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _write_part(self, records):
+        batch = flatten_records(records)
+        path = os.path.join(self.output_dir, f"part-{self._part:05d}.parquet")
+        self.con.register('batch', batch)
+        self.con.execute(f"COPY ({typed_select('batch')}) TO '{sql_literal(path)}' (FORMAT PARQUET)")
+        self.con.unregister('batch')
+        self._part += 1
+        self.rows_written += len(batch)
+        self.logger.info(f"Wrote {len(batch)} rows to {path}. Total rows written: {self.rows_written}.")
@@ -0,0 +1,93 @@
+import pandas as pd
+
+ARTICLE_COLUMNS = {
+    'id': 'VARCHAR',
+    'type': 'VARCHAR',
+    'sectionId': 'VARCHAR',
+    'sectionName': 'VARCHAR',
+    'webPublicationDate': 'TIMESTAMP',
+    'webTitle': 'VARCHAR',
+    'webUrl': 'VARCHAR',
+    'apiUrl': 'VARCHAR',
+    'isHosted': 'BOOLEAN',
+    'pillarId': 'VARCHAR',
+    'pillarName': 'VARCHAR',
+    'headline': 'VARCHAR',
+    'byline': 'VARCHAR',
+}
+
+CATEGORICAL_COLUMNS = ('type', 'sectionId', 'sectionName', 'pillarId', 'pillarName')
+DATETIME_COLUMNS = ('webPublicationDate',)
+BOOLEAN_COLUMNS = ('isHosted',)
+
+def expand_fields(records):
+    """
+    Build a DataFrame from raw Guardian results with the nested `fields` dict expanded into one
+    column per field. Fields that duplicate a top-level column are dropped.
+    Args:
+        records (list): Raw result dicts, each optionally holding a nested `fields` dict.
+    Returns:
+        pandas.DataFrame: One untyped column per top-level key and field.
+    """
+    df = pd.DataFrame.from_records(records)
+    if 'fields' in df.columns:
+        fields = pd.DataFrame.from_records(
+            [value if isinstance(value, dict) else {} for value in df.pop('fields')],
+            index=df.index
+        )
+        fields = fields.drop(columns=[column for column in fields.columns if column in df.columns])
+        df = df.join(fields)
+    return df
+
+def flatten_records(records):
+    """
+    Flatten raw Guardian results into a DataFrame with one column per entry of ARTICLE_COLUMNS.
+    Args:
+        records (list): Raw result dicts, each optionally holding a nested `fields` dict.
+    Returns:
+        pandas.DataFrame: The flattened records, with missing values as None.
+    """
+    df = expand_fields(records).reindex(columns=list(ARTICLE_COLUMNS)).astype(object)
+    return df.where(df.notna(), None)
+
+def normalize_results(results):
+    """
+    Turn raw Guardian results into a flat, compactly typed DataFrame.
+    Builds on `expand_fields`, keeping every returned column, then parses publication dates
+    once into naive UTC `datetime64` and turns low-cardinality columns into categoricals.
+    Args:
+        results (list): Raw Guardian result dicts.
+    Returns:
+        pandas.DataFrame: The normalized articles.
+    """
+    df = expand_fields(results)
+    if df.empty:
+        return df
+
+    for column in DATETIME_COLUMNS:
+        if column in df.columns:
+            df[column] = pd.to_datetime(df[column], utc=True).dt.tz_convert(None)
+    for column in CATEGORICAL_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+    for column in BOOLEAN_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype('boolean')
+    return df
+
+def typed_select(relation):
+    """
+    Build a SELECT list casting every article column of `relation` to its storage type.
+    Returns:
+        str: A SQL query over `relation`.
+    """
+    columns = ",\n                ".join(f'CAST("{name}" AS {sql_type}) AS "{name}"' for name, sql_type in ARTICLE_COLUMNS.items())
+    return f"""
+            SELECT
+                {columns}
+            FROM {relation}
+        """
+
+def sql_literal(value):
+    """Escape a value for use inside a single-quoted SQL string literal."""
+    return str(value).replace("'", "''")
@@ -1 +1,5 @@
-from .reporting_functions import DataProcessor, DataVisualizer
\ No newline at end of file
+from .reporting_functions import DataProcessor, DataVisualizer
+from .anomaly_detection import (AnomalyDetector, GlobalZScoreDetector, RollingZScoreDetector,
+                                RobustZScoreDetector, SeasonalZScoreDetector, get_detector)
+from .headline_index import HeadlineIndex
+from .report_generation import ReportGenerator
@@ -0,0 +1,35 @@
+"""
+Render the static report charts without a notebook.
+
+    python -m src.transformation_analysis --formats html png --workers 4
+
+Figures whose content has not changed since the last run are skipped.
+"""
+import argparse
+from src.storage import ArticleStore
+from .reporting_functions import DataProcessor
+from .report_generation import ReportGenerator
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", default=None, help="article store to report on, defaults to guardian_articles.duckdb")
+    parser.add_argument("--output-dir", default=None)
+    parser.add_argument("--formats", nargs="+", default=['html', 'png'])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--subject", default='Justin Trudeau')
+    parser.add_argument("--max-points", type=int, default=1000, help="downsample longer series to this many points")
+    parser.add_argument("--force", action="store_true", help="render every figure even if unchanged")
+    args = parser.parse_args(argv)
+
+    with ArticleStore(args.db, read_only=True) as store:
+        try:
+            generator = ReportGenerator(DataProcessor.from_store(store), output_dir=args.output_dir, formats=args.formats,
+                                        max_workers=args.workers, subject=args.subject,
+                                        max_points=args.max_points)
+        except ValueError as error:
+            parser.error(str(error))
+        result = generator.generate(force=args.force)
+    print(f"Rendered {len(result['rendered'])} figures, skipped {len(result['skipped'])} unchanged figures.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+class AnomalyDetector:
+    """
+    Base class for detectors that flag unusual daily article counts.
+    Subclasses implement `_score`, returning the baseline and spread every day is compared
+    against. `detect` scores a whole series at once; `update` scores only newly arrived days
+    using the history the detector kept from earlier calls. Spreads below `min_spread` are
+    raised to it, so a flat baseline does not turn every small change into an infinite score.
+    """
+    history_size = 0
+
+    def __init__(self, threshold=2, min_spread=0.0):
+        self.threshold = threshold
+        self.min_spread = min_spread
+        self._history = None
+
+    def detect(self, article_count, date_column='Date', value_column='No_of_articles'):
+        """
+        Score every day of a daily count series.
+        Args:
+            article_count (pandas.DataFrame): The DataFrame containing the article counts per date.
+            date_column (str, optional): The date column. Defaults to 'Date'.
+            value_column (str, optional): The count column. Defaults to 'No_of_articles'.
+        Returns:
+            pandas.DataFrame: `article_count` sorted by date with the added columns `baseline`,
+                `spread`, `score` and `is_unusual`.
+        """
+        scored = article_count.sort_values(date_column).reset_index(drop=True)
+        values = scored[value_column].to_numpy(dtype=float)
+        baseline, spread = self._score(values, pd.to_datetime(scored[date_column]))
+        spread = np.fmax(spread, self.min_spread) if self.min_spread else spread
+        deviation = values - baseline
+        with np.errstate(divide='ignore', invalid='ignore'):
+            score = np.where(deviation == 0, 0.0, deviation / spread)
+        scored['baseline'] = baseline
+        scored['spread'] = spread
+        scored['score'] = score
+        scored['is_unusual'] = np.abs(score) > self.threshold
+        self._remember(scored[[date_column, value_column]])
+        return scored
+
+    def update(self, new_counts, date_column='Date', value_column='No_of_articles'):
+        """
+        Score newly arrived days against the history kept from previous calls.
+        Args:
+            new_counts (pandas.DataFrame): Daily counts for days after the last scored one.
+        Returns:
+            pandas.DataFrame: The scored rows of `new_counts` only.
+        """
+        history = self._history if self._history is not None else new_counts.iloc[0:0]
+        combined = pd.concat([history[[date_column, value_column]], new_counts[[date_column, value_column]]],
+                             ignore_index=True)
+        scored = self.detect(combined, date_column, value_column)
+        return scored.iloc[len(history):].reset_index(drop=True)
+
+    def _remember(self, counts):
+        self._history = counts.tail(self.history_size).reset_index(drop=True) if self.history_size else counts.iloc[0:0]
+
+    def _score(self, values, dates):
+        raise NotImplementedError
+
+
+class GlobalZScoreDetector(AnomalyDetector):
+    """
+    Compare every day with the mean and standard deviation of the whole series.
+    Updates keep running moments, so new days are scored without revisiting old ones.
+    """
+    def __init__(self, threshold=2):
+        super().__init__(threshold)
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def detect(self, article_count, date_column='Date', value_column='No_of_articles'):
+        self._count, self._mean, self._m2 = 0, 0.0, 0.0
+        return super().detect(article_count, date_column, value_column)
+
+    def update(self, new_counts, date_column='Date', value_column='No_of_articles'):
+        return super().detect(new_counts, date_column, value_column)
+
+    def _score(self, values, dates):
+        count = len(values)
+        if count:
+            mean = values.mean()
+            m2 = ((values - mean) ** 2).sum()
+            delta = mean - self._mean
+            total = self._count + count
+            self._m2 += m2 + delta ** 2 * self._count * count / total
+            self._mean += delta * count / total
+            self._count = total
+        spread = np.sqrt(self._m2 / self._count) if self._count else np.nan
+        return np.full(count, self._mean), np.full(count, spread)
+
+
+class RollingZScoreDetector(AnomalyDetector):
+    """
+    Compare every day with the mean and standard deviation of the `window` days before it.
+    """
+    def __init__(self, threshold=2, window=28, min_periods=7, min_spread=1.0):
+        super().__init__(threshold, min_spread)
+        self.window = window
+        self.min_periods = min_periods
+        self.history_size = window
+
+    def _score(self, values, dates):
+        previous = pd.Series(values).shift(1).rolling(self.window, min_periods=self.min_periods)
+        return previous.mean().to_numpy(), previous.std(ddof=0).to_numpy()
+
+
+class RobustZScoreDetector(AnomalyDetector):
+    """
+    Compare every day with the median of the `window` days before it, scaled by their
+    median absolute deviation (MAD), so a few extreme days do not inflate the baseline.
+    When more than half the window has the same count the MAD is 0, and the scaled mean
+    absolute deviation from the median is used instead.
+    """
+    MAD_SCALE = 1.4826
+    MEAN_AD_SCALE = 1.2533
+
+    def __init__(self, threshold=3.5, window=28, min_spread=1.0):
+        super().__init__(threshold, min_spread)
+        self.window = window
+        self.history_size = window
+
+    def _score(self, values, dates):
+        baseline = np.full(len(values), np.nan)
+        spread = np.full(len(values), np.nan)
+        if len(values) > self.window:
+            windows = sliding_window_view(values[:-1], self.window)
+            medians = np.median(windows, axis=1)
+            baseline[self.window:] = medians
+            deviations = np.abs(windows - medians[:, None])
+            mad = self.MAD_SCALE * np.median(deviations, axis=1)
+            spread[self.window:] = np.where(mad > 0, mad, self.MEAN_AD_SCALE * deviations.mean(axis=1))
+        return baseline, spread
+
+
+class SeasonalZScoreDetector(AnomalyDetector):
+    """
+    Compare every day with the same weekday over the previous `window` weeks, so regular
+    weekday/weekend publishing patterns are not flagged.
+    """
+    def __init__(self, threshold=2, window=8, min_periods=4, min_spread=1.0):
+        super().__init__(threshold, min_spread)
+        self.window = window
+        self.min_periods = min_periods
+        self.history_size = window * 7
+
+    def _score(self, values, dates):
+        series = pd.Series(values)
+        previous = series.groupby(dates.dt.dayofweek.to_numpy()).transform(
+            lambda same_weekday: same_weekday.shift(1).rolling(self.window, min_periods=self.min_periods).mean())
+        spread = series.groupby(dates.dt.dayofweek.to_numpy()).transform(
+            lambda same_weekday: same_weekday.shift(1).rolling(self.window, min_periods=self.min_periods).std(ddof=0))
+        return previous.to_numpy(), spread.to_numpy()
+
+
+DETECTORS = {
+    'global': GlobalZScoreDetector,
+    'rolling': RollingZScoreDetector,
+    'robust': RobustZScoreDetector,
+    'seasonal': SeasonalZScoreDetector,
+}
+
+def get_detector(name, **kwargs):
+    """
+    Instantiate a registered anomaly detector.
+    Args:
+        name (str): One of 'global', 'rolling', 'robust' or 'seasonal'.
+        **kwargs: Passed to the detector constructor.
+    Returns:
+        AnomalyDetector: The detector instance.
+    """
+    try:
+        return DETECTORS[name](**kwargs)
+    except KeyError:
+        raise ValueError(f"Invalid detector '{name}'. Allowed values are {', '.join(DETECTORS)}.") from None
@@ -0,0 +1,104 @@
+import re
+import numpy as np
+import pandas as pd
+
+TOKEN_PATTERN = r"\w+"
+POSITION_GAP = 1 << 12
+KEY_GAP = 1 << 24
+
+def tokenize(text):
+    return re.findall(TOKEN_PATTERN, text.lower())
+
+class HeadlineIndex:
+    """
+    In-memory positional inverted index over the titles, headlines and bylines of downloaded
+    articles. New keyword and phrase filters, and term frequencies over time, are answered
+    from posting lists without re-crawling or scanning every row.
+    """
+    def __init__(self, df, columns=('webTitle', 'headline', 'byline'), date_column='webPublicationDate'):
+        """
+        Args:
+            df (pandas.DataFrame): The articles to index.
+            columns (tuple, optional): The text columns to index. Defaults to title, headline and byline.
+            date_column (str, optional): The publication date column. Defaults to 'webPublicationDate'.
+        """
+        self.df = df.reset_index(drop=True)
+        self.dates = pd.to_datetime(self.df[date_column]) if date_column in self.df.columns else None
+        self._build([column for column in columns if column in self.df.columns])
+
+    @classmethod
+    def from_store(cls, store, **kwargs):
+        """
+        Build an index over the articles persisted in an ArticleStore.
+        """
+        return cls(store.to_dataframe(), **kwargs)
+
+    def _build(self, columns):
+        tokens, keys = [], []
+        for column_number, column in enumerate(columns):
+            column_tokens = self.df[column].fillna('').astype(str).str.lower().str.findall(TOKEN_PATTERN).explode().dropna()
+            rows = column_tokens.index.to_numpy(dtype=np.int64)
+            positions = column_tokens.groupby(level=0).cumcount().to_numpy(dtype=np.int64)
+            tokens.append(column_tokens.to_numpy())
+            keys.append(rows * KEY_GAP + column_number * POSITION_GAP + positions)
+
+        tokens = np.concatenate(tokens) if tokens else np.array([], dtype=object)
+        keys = np.concatenate(keys) if keys else np.array([], dtype=np.int64)
+        codes, vocabulary = pd.factorize(tokens)
+        order = np.lexsort((keys, codes))
+        self._keys = keys[order]
+        self._offsets = np.concatenate([[0], np.cumsum(np.bincount(codes, minlength=len(vocabulary)))])
+        self._vocabulary = {token: code for code, token in enumerate(vocabulary)}
+
+    def _token_keys(self, token):
+        code = self._vocabulary.get(token)
+        if code is None:
+            return np.array([], dtype=np.int64)
+        return self._keys[self._offsets[code]:self._offsets[code + 1]]
+
+    def _phrase_rows(self, phrase_tokens):
+        keys = self._token_keys(phrase_tokens[0])
+        for offset, token in enumerate(phrase_tokens[1:], start=1):
+            keys = keys[np.isin(keys + offset, self._token_keys(token))]
+        return np.unique(keys // KEY_GAP)
+
+    def search(self, query):
+        """
+        Find the articles matching every term and "quoted phrase" of `query` (case-insensitive).
+        Returns:
+            numpy.ndarray: Sorted row positions of the matching articles.
+        """
+        phrases = [tokenize(phrase) for phrase in re.findall(r'"([^"]+)"', query)]
+        terms = [[term] for term in tokenize(re.sub(r'"[^"]+"', ' ', query))]
+        rows = None
+        for phrase in phrases + terms:
+            if not phrase:
+                continue
+            matches = self._phrase_rows(phrase)
+            rows = matches if rows is None else np.intersect1d(rows, matches, assume_unique=True)
+        return rows if rows is not None else np.array([], dtype=np.int64)
+
+    def filter(self, query):
+        """
+        Return the articles matching `query`, e.g. '"Justin Trudeau" election'.
+        Returns:
+            pandas.DataFrame: The matching rows of the indexed DataFrame.
+        """
+        return self.df.iloc[self.search(query)]
+
+    def term_frequency(self, queries, freq='D'):
+        """
+        Count the articles matching each query per period.
+        Args:
+            queries (list): Keywords or "quoted phrases".
+            freq (str, optional): A pandas frequency such as 'D', 'W' or 'MS'. Defaults to 'D'.
+        Returns:
+            pandas.DataFrame: One column of article counts per query, indexed by period.
+        """
+        if self.dates is None:
+            raise ValueError("The index was built without a publication date column.")
+        counts = {}
+        for query in queries:
+            dates = self.dates.iloc[self.search(query)]
+            counts[query] = pd.Series(1, index=pd.DatetimeIndex(dates)).resample(freq).sum()
+        return pd.DataFrame(counts).fillna(0).astype(int)
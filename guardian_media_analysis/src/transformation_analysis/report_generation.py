@@ -0,0 +1,138 @@
+import hashlib
+import importlib.util
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import plotly.io as pio
+from src.utility import setup_logger, fetch_config
+from .reporting_functions import DataVisualizer
+
+TIME_GRANULARITIES = ('day', 'week', 'month', 'year')
+IMAGE_FORMATS = ('png', 'jpeg', 'webp', 'svg', 'pdf')
+MANIFEST_NAME = '.report_manifest.json'
+
+def _render_figure(figure_json, base_path, formats):
+    """
+    Write one figure, serialized as plotly JSON, to `base_path` in every requested format.
+    Runs in a worker process.
+    """
+    fig = pio.from_json(figure_json)
+    os.makedirs(os.path.dirname(base_path), exist_ok=True)
+    for fmt in formats:
+        if fmt == 'html':
+            fig.write_html(f"{base_path}.html", include_plotlyjs='cdn')
+        else:
+            fig.write_image(f"{base_path}.{fmt}")
+    return base_path
+
+class ReportGenerator:
+    """
+    Headless generator for the report charts: the section bar chart, the article counts by day,
+    week, month and year, and the unusual-events box plot. Every aggregate is computed once,
+    the charts are rendered in a process pool, and a manifest of figure content hashes under
+    the output directory lets unchanged charts be skipped on the next run.
+    """
+    def __init__(self, data_processor, output_dir=None, formats=('html', 'png'), max_workers=None, subject='Justin Trudeau',
+                 max_points=1000):
+        """
+        Args:
+            data_processor (DataProcessor): The processor the aggregates are computed with.
+            output_dir (str, optional): Where the charts are written. Defaults to `reports/`
+                next to config.ini.
+            formats (tuple, optional): Output formats: 'html' and image formats such as 'png',
+                which need the kaleido package. Defaults to ('html', 'png').
+            max_workers (int, optional): The number of rendering processes. Defaults to the CPU count.
+            subject (str, optional): Who the charts are about. Defaults to 'Justin Trudeau'.
+            max_points (int, optional): The most points a time series or box plot sends to the
+                chart; longer series are downsampled. None plots every point. Defaults to 1000.
+        Raises:
+            ValueError: A requested format is unknown, or is an image format and kaleido is not installed.
+        """
+        if output_dir is None:
+            _, config_path = fetch_config()
+            output_dir = os.path.join(os.path.dirname(config_path), 'reports')
+        self.logger = setup_logger(__name__)
+        self.data_processor = data_processor
+        self.output_dir = output_dir
+        self.max_workers = max_workers
+        self.max_points = max_points
+        self.visualizer = DataVisualizer(None, con=data_processor.con, subject=subject)
+        self.formats = tuple(formats)
+        unknown = [fmt for fmt in self.formats if fmt != 'html' and fmt not in IMAGE_FORMATS]
+        if unknown:
+            raise ValueError(f"Unknown report format(s) {', '.join(unknown)}. Allowed values are html, {', '.join(IMAGE_FORMATS)}.")
+        images = [fmt for fmt in self.formats if fmt in IMAGE_FORMATS]
+        if images and importlib.util.find_spec('kaleido') is None:
+            self.logger.error(f"Cannot write {', '.join(images)} reports: kaleido is not installed.")
+            raise ValueError(f"Writing {', '.join(images)} reports needs the kaleido package. Install it or pass --formats html.")
+        self.manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+
+    def build_figures(self):
+        """
+        Compute the aggregates once and build every report figure. Each granularity comes from
+        `get_article_counts`, so over an ArticleStore the weekly, monthly and yearly counts are
+        served from the daily rollup.
+        Returns:
+            dict: Figures keyed by their output path relative to the output directory, without extension.
+        """
+        counts = {group_by: self.data_processor.get_article_counts(group_by) for group_by in TIME_GRANULARITIES}
+        top_sections = self.data_processor.get_top_section()
+
+        figures = {'articles_by_section': self.visualizer.plot_articles_by_section(top_sections, show=False)}
+        for group_by, article_count in counts.items():
+            figures[f'evolution_of_articles/by_{group_by}'] = self.visualizer.plot_article_by_time(
+                article_count, group_by=group_by, show=False, max_points=self.max_points)
+        figures['unusual_events_boxplot'] = self.visualizer.plot_unusual_events(counts['day'], show=False, max_points=self.max_points)
+        return figures
+
+    def _load_manifest(self):
+        if not os.path.exists(self.manifest_path):
+            return {}
+        with open(self.manifest_path) as file:
+            return json.load(file)
+
+    def _save_manifest(self, manifest):
+        os.makedirs(self.output_dir, exist_ok=True)
+        with open(self.manifest_path, 'w') as file:
+            json.dump(manifest, file, indent=2, sort_keys=True)
+
+    def _is_current(self, name, digest, manifest):
+        base_path = os.path.join(self.output_dir, name)
+        return manifest.get(name) == digest and all(os.path.exists(f"{base_path}.{fmt}") for fmt in self.formats)
+
+    def generate(self, force=False):
+        """
+        Render every report figure whose content changed since the last run.
+        Args:
+            force (bool, optional): Render all figures even when they are unchanged. Defaults to False.
+        Returns:
+            dict: The names of the 'rendered' and 'skipped' figures.
+        """
+        manifest = self._load_manifest()
+        pending, skipped = {}, []
+        for name, fig in self.build_figures().items():
+            figure_json = fig.to_json()
+            digest = hashlib.sha256(figure_json.encode('utf-8')).hexdigest()
+            if not force and self._is_current(name, digest, manifest):
+                skipped.append(name)
+            else:
+                pending[name] = (figure_json, digest)
+
+        rendered = []
+        if pending:
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context) as executor:
+                futures = {
+                    executor.submit(_render_figure, figure_json, os.path.join(self.output_dir, name), self.formats): name
+                    for name, (figure_json, _) in pending.items()
+                }
+                for future in as_completed(futures):
+                    name = futures[future]
+                    future.result()
+                    manifest[name] = pending[name][1]
+                    rendered.append(name)
+            self._save_manifest(manifest)
+
+        self.logger.info(f"Rendered {len(rendered)} report figures, skipped {len(skipped)} unchanged figures.")
+        return {'rendered': sorted(rendered), 'skipped': skipped}
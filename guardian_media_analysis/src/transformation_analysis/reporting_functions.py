@@ -1,36 +1,104 @@
 import duckdb
-import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 import seaborn as sns
+from .anomaly_detection import get_detector
+from src.utility import timed
 
 class DataProcessor:
     """
     A class for processing and analyzing data related to Justin Trudeau articles.
     """
-    def __init__(self, df):
-        self.df = df
+    def __init__(self, df=None, con=None, table='articles'):
+        """
+        Args:
+            df (pandas.DataFrame, optional): The articles to analyse. When given, they are
+                materialized once into a typed DuckDB table named `table`.
+            con (duckdb.DuckDBPyConnection, optional): The connection every analytics query goes
+                through. Defaults to a new in-memory connection.
+            table (str, optional): The name of the articles table. Defaults to 'articles'.
+        """
+        self._owns_connection = con is None
+        self.con = duckdb.connect() if con is None else con
+        self.table = table
+        self.rollup_table = None
+        self._df = df
+        if df is not None:
+            self._materialize(df)
+
+    @classmethod
+    def from_store(cls, store, table='articles'):
+        """
+        Create a processor that queries the articles persisted in an ArticleStore directly.
+        Args:
+            store (src.storage.ArticleStore): The store to read the articles from.
+            table (str, optional): 'articles', or 'query_articles' for the articles tagged with
+                their search query. Defaults to 'articles'. Over 'articles', daily counts, sections
+                and totals are served from the store's `daily_counts` rollup.
+        Returns:
+            DataProcessor: A processor sharing the store's connection.
+        """
+        processor = cls(con=store.con, table=table)
+        if table == 'articles':
+            processor.rollup_table = 'daily_counts'
+        return processor
 
+    @property
+    def df(self):
+        """
+        The articles as a pandas DataFrame, loaded from the articles table on first access.
+        """
+        if self._df is None:
+            self._df = self.con.execute(f"SELECT * FROM {self.table}").fetchdf()
+        return self._df
+
+    @df.setter
+    def df(self, df):
+        self._df = df
+
+    @timed('analytics')
+    def _materialize(self, df):
+        """
+        Register the DataFrame once and store it as a typed temporary table.
+        """
+        df = df.copy(deep=False)
+        if isinstance(df['webPublicationDate'].dtype, pd.DatetimeTZDtype):
+            df['webPublicationDate'] = df['webPublicationDate'].dt.tz_convert(None)
+        self.con.register('articles_source', df)
+        self.con.execute(f"""
+            CREATE OR REPLACE TEMP TABLE {self.table} AS
+            SELECT * REPLACE (CAST(webPublicationDate AS TIMESTAMP) AS webPublicationDate)
+            FROM articles_source
+        """)
+        self.con.unregister('articles_source')
+
+    def close(self):
+        """
+        Close the connection if the processor created it.
+        """
+        if self._owns_connection:
+            self.con.close()
+
+    @timed('analytics')
     def get_trudeau_articles_count(self):
         """
         Retrieve the count of articles related to Justin Trudeau over time.
         Returns:
             tuple: A tuple containing the result DataFrame and the average number of articles per day.
         """
-        con = duckdb.connect()
-        query = """ 
+        query = f"""
             with date_series as(
                 SELECT day::date as complete_date
                 FROM generate_series('2018-01-01'::date, current_date, INTERVAL '1 day') as series(day)
             ),
+            daily_articles as({self._daily_articles_sql()}),
             article_count as(
-                select date_series.complete_date Date, coalesce(count(df.webPublicationDate), 0) as No_of_articles
-                from date_series left join df 
-                on date_series.complete_date = df.webPublicationDate::date and df.type = 'article'
-                group by date_series.complete_date
+                select date_series.complete_date Date, coalesce(daily_articles.article_count, 0) as No_of_articles
+                from date_series left join daily_articles
+                on date_series.complete_date = daily_articles.publication_date
             ),
             average_article as (
                 select Date, No_of_articles, avg(No_of_articles) over() as avg_articles_per_day
@@ -39,128 +107,307 @@ class DataProcessor:
             select * from average_article order by Date
         """
 
-        result = con.execute(query).fetchdf()
-        con.close()
+        result = self.con.execute(query).fetchdf()
         if not result.empty and 'avg_articles_per_day' in result.columns:
             avg_count = result['avg_articles_per_day'].iloc[0]
         else:
             avg_count = -999
         return result, avg_count
 
+    @timed('analytics')
+    def get_article_counts(self, group_by='day'):
+        """
+        Retrieve the number of articles per day, week, month or year since 2018.
+        Served from the daily rollup when the processor reads an ArticleStore.
+        Args:
+            group_by (str, optional): 'day', 'week', 'month' or 'year'. Defaults to 'day'.
+        Returns:
+            pandas.DataFrame: The columns `Date` (start of each period) and `No_of_articles`.
+        """
+        if group_by not in ('day', 'week', 'month', 'year'):
+            raise ValueError("Invalid group_by value. Allowed values are 'month', 'year', 'week', or 'day'.")
+
+        query = f"""
+            with date_series as(
+                SELECT day::date as complete_date
+                FROM generate_series('2018-01-01'::date, current_date, INTERVAL '1 day') as series(day)
+            ),
+            daily_articles as({self._daily_articles_sql()})
+            select DATE_TRUNC('{group_by}', date_series.complete_date)::date as Date,
+                   sum(coalesce(daily_articles.article_count, 0))::bigint as No_of_articles
+            from date_series left join daily_articles
+            on date_series.complete_date = daily_articles.publication_date
+            group by 1
+            order by 1
+        """
+        return self.con.execute(query).fetchdf()
+
+    def _daily_articles_sql(self):
+        """
+        SQL for the number of articles per publication day, from the rollup when available.
+        """
+        if self.rollup_table:
+            return f"""
+                select day as publication_date, sum(article_count)::bigint as article_count
+                from {self.rollup_table}
+                where type = 'article'
+                group by day
+            """
+        return f"""
+                select webPublicationDate::date as publication_date, count(*) as article_count
+                from {self.table}
+                where type = 'article'
+                group by publication_date
+            """
+
+    @timed('analytics')
     def get_top_section(self):
         """
         Identify the top sections with the most articles.
         Returns:
             pandas.DataFrame: A DataFrame containing the section names and their article counts.
         """
-        con = duckdb.connect()
-        query = """
-            SELECT sectionName, count(*) as section_count
-            FROM df
+        if self.rollup_table:
+            source, article_count = self.rollup_table, "sum(article_count)::bigint"
+        else:
+            source, article_count = self.table, "count(*)"
+        query = f"""
+            SELECT sectionName, {article_count} as section_count
+            FROM {source}
             WHERE type = 'article'
             GROUP BY sectionName
             ORDER BY section_count DESC
         """
-        result = con.execute(query).fetchdf()
-        con.close()
-        return result
+        return self.con.execute(query).fetchdf()
 
+    @timed('analytics')
     def get_total_article_count(self):
         """
         Calculate the total number of articles since 2018.
         Returns:
             int: The total count of articles.
         """
-
-        con = duckdb.connect()
-        query = """
+        query = f"""
             SELECT COUNT(*) AS total_articles
-            FROM (
-                SELECT CAST(webPublicationDate AS DATE) AS date, COUNT(*) AS article_count
-                FROM df
-                WHERE type = 'article'
-                  AND webPublicationDate >= '2018-01-01'
-                GROUP BY CAST(webPublicationDate AS DATE)
-            ) AS daily_counts
+            FROM ({self._daily_articles_sql()}) AS daily_counts
             WHERE article_count > 0
+              AND publication_date >= '2018-01-01'
         """
 
-        result = con.execute(query).fetchdf()
-        con.close()
+        result = self.con.execute(query).fetchdf()
         if not result.empty and 'total_articles' in result.columns:
             total_count = result['total_articles'].iloc[0]
         else:
             total_count = 0
         return total_count
 
-    def get_unusual_events(self, article_count, threshold=2):
+    @timed('analytics')
+    def get_articles_count_by_query(self):
+        """
+        Retrieve the daily article counts of every search query in one pass.
+        The articles must carry a `query` column, e.g. from `GuardianAPI.batch_to_dataframe`
+        or the `query_articles` table of an ArticleStore.
+        Returns:
+            pandas.DataFrame: The columns `query`, `Date`, `No_of_articles` and `avg_articles_per_day`.
+        """
+        query = f"""
+            with date_series as(
+                SELECT day::date as complete_date
+                FROM generate_series('2018-01-01'::date, current_date, INTERVAL '1 day') as series(day)
+            ),
+            queries as(
+                select distinct query::varchar as query from {self.table}
+            ),
+            daily_articles as(
+                select query::varchar as query, webPublicationDate::date as publication_date, count(*) as article_count
+                from {self.table}
+                where type = 'article'
+                group by 1, 2
+            ),
+            article_count as(
+                select queries.query, date_series.complete_date Date, coalesce(daily_articles.article_count, 0) as No_of_articles
+                from queries cross join date_series
+                left join daily_articles
+                on daily_articles.query = queries.query and daily_articles.publication_date = date_series.complete_date
+            )
+            select *, avg(No_of_articles) over(partition by query) as avg_articles_per_day
+            from article_count
+            order by query, Date
+        """
+        return self.con.execute(query).fetchdf()
+
+    @timed('analytics')
+    def get_top_section_by_query(self):
+        """
+        Identify the sections with the most articles for every search query in one pass.
+        Returns:
+            pandas.DataFrame: The columns `query`, `sectionName`, `section_count` and `section_rank`.
+        """
+        query = f"""
+            with section_counts as(
+                SELECT query::varchar AS query, sectionName, count(*) as section_count
+                FROM {self.table}
+                WHERE type = 'article'
+                GROUP BY 1, 2
+            )
+            select *, row_number() over(partition by query order by section_count desc, sectionName) as section_rank
+            from section_counts
+            order by query, section_rank
+        """
+        return self.con.execute(query).fetchdf()
+
+    @timed('analytics')
+    def get_unusual_events_by_query(self, article_counts, threshold=None, detector='global'):
+        """
+        Detect unusual events separately for every search query.
+        The default global z-score is computed for all queries in one DuckDB pass, with the mean
+        and standard deviation windowed by query. Other detectors run once per query.
+        Args:
+            article_counts (pandas.DataFrame): The result of `get_articles_count_by_query`.
+            threshold (float, optional): The score beyond which a day is unusual. Defaults to the
+                detector's own threshold: 2 for 'global', 'rolling' and 'seasonal', 3.5 for 'robust'.
+            detector (str, optional): The detection method, see `get_unusual_events`. Defaults to 'global'.
+        Returns:
+            pandas.DataFrame: The unusual event dates of every query, most articles first within each query.
+        """
+        if detector == 'global':
+            self.con.register('article_counts', article_counts)
+            events = self.con.execute("""
+                with scored as(
+                    select *,
+                           avg(No_of_articles) over(partition by query) as baseline,
+                           stddev_pop(No_of_articles) over(partition by query) as spread
+                    from article_counts
+                ),
+                scores as(
+                    select *, case when No_of_articles = baseline then 0
+                                   else (No_of_articles - baseline) / spread end as score
+                    from scored
+                )
+                select * from scores
+                where abs(score) > ?
+                order by query, No_of_articles desc, Date
+            """, [2 if threshold is None else threshold]).fetchdf()
+            self.con.unregister('article_counts')
+            return events
+
+        events = [
+            self.get_unusual_events(counts, threshold, detector)
+            for _, counts in article_counts.groupby('query', sort=True)
+        ]
+        if not events:
+            return article_counts.iloc[0:0]
+        return pd.concat(events, ignore_index=True)
+
+    @timed('analytics')
+    def get_unusual_events(self, article_count, threshold=None, detector='global'):
         """
          Detect unusual events based on the number of articles published on each date.
         Args:
             article_count (pandas.DataFrame): The DataFrame containing the article counts per date.
-            threshold (int, optional): The threshold for determining unusual events. Defaults to 2.
+            threshold (float, optional): The score beyond which a day is unusual. Defaults to the
+                detector's own threshold: 2 for 'global', 'rolling' and 'seasonal', 3.5 for 'robust'.
+            detector (str or AnomalyDetector, optional): The detection method: 'global' (z-score
+                against the whole series), 'rolling', 'robust' (median/MAD) or 'seasonal'
+                (same-weekday baseline), or a detector instance. Defaults to 'global'.
         Returns:
-            pandas.DataFrame: A DataFrame containing the unusual event dates and their article counts.
+            pandas.DataFrame: A DataFrame containing the unusual event dates and their article counts,
+                with the baseline, spread and score each date was judged by.
         """
+        if isinstance(detector, str):
+            detector = get_detector(detector, **({} if threshold is None else {'threshold': threshold}))
 
-        mean_articles = np.mean(article_count['No_of_articles'])
-        std_articles = np.std(article_count['No_of_articles'])
-
-        unusual_events = article_count[(article_count['No_of_articles'] > mean_articles + threshold * std_articles) |
-                                       (article_count['No_of_articles'] < mean_articles - threshold * std_articles)]
+        scored = detector.detect(article_count)
+        unusual_events = scored[scored['is_unusual']].drop(columns='is_unusual')
 
         unusual_events = unusual_events.sort_values('No_of_articles', ascending=False)
 
         return unusual_events
 
+    @timed('analytics')
     def get_articles_unusual_events(self, unusual_dates):
         """
         Retrieve the headlines of articles published on unusual event dates.
         Args:
             unusual_dates (list): A list of unusual event dates.
+        Returns:
+            pandas.DataFrame: One row per (event date, article) with the columns `event_date`,
+                `article_count` and `webTitle`, in the order of `unusual_dates`. Dates without
+                articles keep a single row with a missing `webTitle`.
         """
-        self.df['webPublicationDate'] = pd.to_datetime(self.df['webPublicationDate'])
-        
-        unusual_articles = self.df[(self.df['webPublicationDate'].dt.date.astype(str).isin(unusual_dates)) & (self.df['type'] == 'article')]
-        
-        for date in unusual_dates:
-            print(f"Unusual Event Date: {date}")
-            print("Article Headlines:")
-            articles_on_date = unusual_articles[unusual_articles['webPublicationDate'].dt.date.astype(str) == date]
-            
-            if articles_on_date.empty:
-                print("No articles found for this date.")
-            else:
-                for _, article in articles_on_date.iterrows():
-                    print(f"- {article['webTitle']}")
-            
-            print()
+        return self._unusual_event_articles(unusual_dates, ['webTitle'])
 
+    @timed('analytics')
     def get_unusual_event_details(self, unusual_dates):
         """
         Provide detailed information about articles published on unusual event dates.
         Args:
             unusual_dates (list): A list of unusual event dates.
+        Returns:
+            pandas.DataFrame: One row per (event date, article) with the columns `event_date`,
+                `article_count`, `webPublicationDate`, `webTitle`, `sectionName` and `webUrl`.
         """
-        for date in unusual_dates:
-            start_date = pd.to_datetime(date).date() 
+        return self._unusual_event_articles(unusual_dates, ['webPublicationDate', 'webTitle', 'sectionName', 'webUrl'])
 
-            event_articles = self.df[
-                (self.df['webPublicationDate'].dt.date == start_date) &  
-                (self.df['type'] == 'article')
-            ]
+    def _unusual_event_articles(self, unusual_dates, columns):
+        """
+        Join the unusual dates against the articles table in a single query.
+        """
+        dates = pd.DataFrame({'event_date': pd.to_datetime(pd.Series(list(unusual_dates), dtype=object))})
+        dates['event_order'] = range(len(dates))
+        selected = ", ".join(f"a.{column}" for column in columns)
 
-            print(f"Event Date: {date}")
-            print(f"Total Articles: {len(event_articles)}")
-            print("Article Details:")
+        self.con.register('unusual_dates', dates)
+        query = f"""
+            SELECT d.event_date::date AS event_date,
+                   count(a.webPublicationDate) OVER (PARTITION BY d.event_order) AS article_count,
+                   {selected}
+            FROM unusual_dates d
+            LEFT JOIN {self.table} a
+              ON a.webPublicationDate::date = d.event_date::date AND a.type = 'article'
+            ORDER BY d.event_order, a.webPublicationDate
+        """
+        result = self.con.execute(query).fetchdf()
+        self.con.unregister('unusual_dates')
+        return result
 
-            for _, article in event_articles.iterrows():
-                print(f"Date: {article['webPublicationDate'].date()}")
-                print(f"Headline: {article['webTitle']}")
-                print(f"Section: {article['sectionName']}")
-                print(f"URL: {article['webUrl']}")
-                print("---")
-            
+    @staticmethod
+    def render_unusual_events(events):
+        """
+        Print the headlines returned by `get_articles_unusual_events`, grouped by event date.
+        Args:
+            events (pandas.DataFrame): The result of `get_articles_unusual_events`.
+        """
+        for date, articles in events.groupby('event_date', sort=False):
+            print(f"Unusual Event Date: {pd.Timestamp(date).date()}")
+            print("Article Headlines:")
+            titles = articles['webTitle'].dropna()
+            if titles.empty:
+                print("No articles found for this date.")
+            else:
+                print("\n".join("- " + titles))
+            print()
+
+    @staticmethod
+    def render_unusual_event_details(details):
+        """
+        Print the article details returned by `get_unusual_event_details`, grouped by event date.
+        Args:
+            details (pandas.DataFrame): The result of `get_unusual_event_details`.
+        """
+        for date, articles in details.groupby('event_date', sort=False):
+            articles = articles.dropna(subset=['webTitle'])
+            print(f"Event Date: {pd.Timestamp(date).date()}")
+            print(f"Total Articles: {len(articles)}")
+            print("Article Details:")
+            if not articles.empty:
+                print("\n".join(
+                    "Date: " + articles['webPublicationDate'].dt.date.astype(str)
+                    + "\nHeadline: " + articles['webTitle'].astype(str)
+                    + "\nSection: " + articles['sectionName'].astype(str)
+                    + "\nURL: " + articles['webUrl'].astype(str)
+                    + "\n---"
+                ))
             print()
 
 
@@ -169,38 +416,63 @@ class DataVisualizer:
     """
     A class for visualizing data related to Justin Trudeau articles.
     """
-    def __init__(self, df):
+    def __init__(self, df, con=None, subject='Justin Trudeau'):
+        """
+        Args:
+            df (pandas.DataFrame): The articles to visualize.
+            con (duckdb.DuckDBPyConnection, optional): The connection used for aggregations,
+                typically `DataProcessor.con`. Defaults to a new in-memory connection.
+            subject (str, optional): Who the articles are about, used in chart titles.
+                Defaults to 'Justin Trudeau'.
+        """
         self.df = df
+        self.subject = subject
+        self.con = duckdb.connect() if con is None else con
 
-    def plot_articles_by_section(self, top_section_df):
+    @timed('analytics')
+    def plot_articles_by_section(self, top_section_df, show=True):
         """
         Create a bar chart showing the number of articles by section.
         Args:
             top_section_df (pandas.DataFrame): The DataFrame containing the top sections and their article counts.
+            show (bool, optional): Display the figure. Defaults to True.
+        Returns:
+            plotly.graph_objects.Figure: The bar chart.
         """
         fig = px.bar(top_section_df, x='sectionName', y='section_count', 
                      title='Number of Articles by Section',
                      labels={'sectionName': 'Section Name', 'section_count': 'Number of Articles'})
-        fig.show()
+        if show:
+            fig.show()
+        return fig
 
-    def plot_article_by_time(self, article_count, group_by='month'):
+    @timed('analytics')
+    def plot_article_by_time(self, article_count, group_by='month', show=True, max_points=None):
         """
-        Generate a bar chart displaying the number of articles about Justin Trudeau over time.
+        Generate a bar chart displaying the number of articles about the subject over time.
 
         Args:
             article_count (pandas.DataFrame): The DataFrame containing the article counts per date.
             group_by (str, optional): The time unit to group the articles by. Defaults to 'month'.
                 Allowed values are 'month', 'year', 'week', or 'day'.
+            show (bool, optional): Display the figure. Defaults to True.
+            max_points (int, optional): Downsample longer series in DuckDB to at most this many
+                points, keeping the lowest and highest count of each bucket so spikes survive.
+                Defaults to None, which plots every point.
+        Returns:
+            plotly.graph_objects.Figure: The bar chart.
         """
-        con = duckdb.connect()
-
         query = f"""
             SELECT DATE_TRUNC('{group_by}', Date) AS group_date, SUM(No_of_articles) AS total_articles
             FROM article_count
             GROUP BY group_date
             ORDER BY group_date
         """
-        grouped_data = con.execute(query).df()
+        if max_points is not None:
+            query = self._min_max_downsample(query, max_points)
+        self.con.register('article_count', article_count)
+        grouped_data = self.con.execute(query).df()
+        self.con.unregister('article_count')
 
         if group_by == 'month':
             x_title = 'Month'
@@ -225,7 +497,7 @@ class DataVisualizer:
                                     name='Number of Articles', marker_color='#1f77b4', marker_opacity=0.8)])
 
         fig.update_layout(
-            title=f'<b>Number of Articles about Justin Trudeau (Grouped by {group_by_title})</b>',
+            title=f'<b>Number of Articles about {self.subject} (Grouped by {group_by_title})</b>',
             xaxis_title=x_title,
             yaxis_title='Number of Articles',
             xaxis=dict(
@@ -236,33 +508,126 @@ class DataVisualizer:
             paper_bgcolor='white'
         )
 
-        fig.show()
+        if show:
+            fig.show()
+        return fig
+
+    @staticmethod
+    def _min_max_downsample(query, max_points):
+        """
+        Wrap a (group_date, total_articles) query so that series longer than `max_points` keep
+        only the minimum and maximum point of each of `max_points // 2` equal-count buckets.
+        """
+        buckets = max(max_points // 2, 1)
+        return f"""
+            with series as (
+                SELECT group_date, total_articles,
+                       row_number() OVER (ORDER BY group_date) - 1 AS position,
+                       count(*) OVER () AS series_length
+                FROM ({query})
+            ),
+            bucketed as (
+                SELECT *, position * {buckets} // series_length AS bucket FROM series
+            ),
+            extremes as (
+                SELECT arg_min(group_date, total_articles) AS min_date, arg_max(group_date, total_articles) AS max_date
+                FROM bucketed
+                GROUP BY bucket
+            )
+            SELECT group_date, total_articles
+            FROM bucketed
+            WHERE series_length <= {max_points}
+               OR group_date IN (SELECT min_date FROM extremes UNION SELECT max_date FROM extremes)
+            ORDER BY group_date
+        """
+
+    @staticmethod
+    def _hover_text(article_count):
+        """
+        Build the date/count hover labels of a box plot with vectorized string operations.
+        """
+        dates = pd.to_datetime(article_count['Date']).dt.strftime('%Y-%m-%d')
+        return ("Date: " + dates + "<br>Number of Articles: " + article_count['No_of_articles'].astype(str)).tolist()
 
-    def plot_unusual_events(self, article_count):
+    def _box_summary(self, article_count):
+        """
+        Compute the quartiles, mean and 1.5 IQR whisker fences of the daily counts in DuckDB,
+        and return them with the days outside the fences.
+        """
+        self.con.register('article_count', article_count)
+        summary = self.con.execute("""
+            with quartiles as (
+                SELECT quantile_cont(No_of_articles, 0.25) AS q1,
+                       quantile_cont(No_of_articles, 0.5) AS median,
+                       quantile_cont(No_of_articles, 0.75) AS q3,
+                       avg(No_of_articles) AS mean
+                FROM article_count
+            ),
+            bounds as (
+                SELECT *, q1 - 1.5 * (q3 - q1) AS lower_bound, q3 + 1.5 * (q3 - q1) AS upper_bound FROM quartiles
+            )
+            SELECT q1, median, q3, mean, lower_bound, upper_bound,
+                   min(No_of_articles) FILTER (WHERE No_of_articles >= lower_bound) AS lowerfence,
+                   max(No_of_articles) FILTER (WHERE No_of_articles <= upper_bound) AS upperfence
+            FROM article_count, bounds
+            GROUP BY q1, median, q3, mean, lower_bound, upper_bound
+        """).df().iloc[0]
+        outliers = self.con.execute("""
+            SELECT Date, No_of_articles FROM article_count
+            WHERE No_of_articles < ? OR No_of_articles > ?
+            ORDER BY Date
+        """, [summary['lower_bound'], summary['upper_bound']]).df()
+        self.con.unregister('article_count')
+        return summary, outliers
+
+    @timed('analytics')
+    def plot_unusual_events(self, article_count, show=True, max_points=None):
         """
         Visualize the distribution of the number of articles using a box plot, highlighting unusual events.
 
         Args:
             article_count (pandas.DataFrame): The DataFrame containing the article counts per date.
+            show (bool, optional): Display the figure. Defaults to True.
+            max_points (int, optional): For longer series, compute the box statistics in DuckDB
+                and plot only the days outside the whiskers. Defaults to None, which sends every
+                day to the box plot.
+        Returns:
+            plotly.graph_objects.Figure: The box plot.
         """
-      
         fig = go.Figure()
+        marker = dict(
+            color='rgb(8,81,156)',
+            outliercolor='rgba(219, 64, 82, 0.6)',
+            line=dict(outliercolor='rgba(219, 64, 82, 0.6)', outlierwidth=2)
+        )
 
-        hover_text = [f"Date: {date}<br>Number of Articles: {count}" for date, count in
-                      zip(article_count['Date'], article_count['No_of_articles'])]
-
-        fig.add_trace(go.Box(
-            y=article_count['No_of_articles'],
-            name='Number of Articles',
-            boxpoints='suspectedoutliers',  
-            text=hover_text,  
-            hoverinfo='text',  
-            marker=dict(
-                color='rgb(8,81,156)',
-                outliercolor='rgba(219, 64, 82, 0.6)',
-                line=dict(outliercolor='rgba(219, 64, 82, 0.6)', outlierwidth=2)
-            )
-        ))
+        if max_points is not None and len(article_count) > max_points:
+            summary, outliers = self._box_summary(article_count)
+            fig.add_trace(go.Box(
+                x=['Number of Articles'],
+                name='Number of Articles',
+                q1=[summary['q1']], median=[summary['median']], q3=[summary['q3']], mean=[summary['mean']],
+                lowerfence=[summary['lowerfence']], upperfence=[summary['upperfence']],
+                hoverinfo='y',
+                marker=marker
+            ))
+            fig.add_trace(go.Scatter(
+                x=['Number of Articles'] * len(outliers),
+                y=outliers['No_of_articles'],
+                mode='markers',
+                text=self._hover_text(outliers),
+                hoverinfo='text',
+                marker=dict(color='rgba(219, 64, 82, 0.6)', line=dict(color='rgba(219, 64, 82, 0.6)', width=2))
+            ))
+        else:
+            fig.add_trace(go.Box(
+                y=article_count['No_of_articles'],
+                name='Number of Articles',
+                boxpoints='suspectedoutliers',
+                text=self._hover_text(article_count),
+                hoverinfo='text',
+                marker=marker
+            ))
 
         fig.update_layout(
             title='Box Plot of Number of Articles',
@@ -270,4 +635,6 @@ class DataVisualizer:
             showlegend=False
         )
 
-        fig.show()
\ No newline at end of file
+        if show:
+            fig.show()
+        return fig
@@ -1,2 +1,5 @@
-from .logger import setup_logger
-from .fetch_config import fetch_config
\ No newline at end of file
+from .logger import setup_logger, flush_logs
+from .fetch_config import fetch_config
+from .date_windows import split_date_range, bisect_date_range, merge_results
+from .watermark import WatermarkStore
+from .metrics import MetricsRegistry, metrics, timed, profile
\ No newline at end of file
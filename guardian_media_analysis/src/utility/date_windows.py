@@ -0,0 +1,67 @@
+from datetime import date, timedelta
+
+DATE_FORMAT = "%Y-%m-%d"
+
+def split_date_range(from_date, to_date, window='month'):
+    """
+    Split an inclusive date range into consecutive, non-overlapping windows.
+    Args:
+        from_date (str): Start date (YYYY-MM-DD).
+        to_date (str): End date (YYYY-MM-DD).
+        window (str, optional): 'month' or 'week'. Defaults to 'month'.
+    Returns:
+        list: (from_date, to_date) string tuples covering the range.
+    """
+    start = date.fromisoformat(from_date)
+    end = date.fromisoformat(to_date)
+    if start > end:
+        raise ValueError(f"from_date {from_date} is after to_date {to_date}.")
+
+    windows = []
+    while start <= end:
+        if window == 'month':
+            next_start = (start.replace(day=1) + timedelta(days=32)).replace(day=1)
+        elif window == 'week':
+            next_start = start + timedelta(days=7 - start.weekday())
+        else:
+            raise ValueError("Invalid window value. Allowed values are 'month' or 'week'.")
+        window_end = min(next_start - timedelta(days=1), end)
+        windows.append((start.strftime(DATE_FORMAT), window_end.strftime(DATE_FORMAT)))
+        start = next_start
+    return windows
+
+def bisect_date_range(from_date, to_date):
+    """
+    Split an inclusive date range into two halves.
+    Returns:
+        list: Two (from_date, to_date) tuples, or None when the range is a single day.
+    """
+    start = date.fromisoformat(from_date)
+    end = date.fromisoformat(to_date)
+    if start >= end:
+        return None
+    middle = start + (end - start) // 2
+    return [
+        (start.strftime(DATE_FORMAT), middle.strftime(DATE_FORMAT)),
+        ((middle + timedelta(days=1)).strftime(DATE_FORMAT), end.strftime(DATE_FORMAT)),
+    ]
+
+def merge_results(result_lists):
+    """
+    Concatenate result lists, keeping the first occurrence of every article id.
+    Args:
+        result_lists (iterable): Lists of raw Guardian result dicts.
+    Returns:
+        list: The merged results.
+    """
+    seen = set()
+    merged = []
+    for results in result_lists:
+        for result in results:
+            article_id = result.get('id')
+            if article_id is not None:
+                if article_id in seen:
+                    continue
+                seen.add(article_id)
+            merged.append(result)
+    return merged
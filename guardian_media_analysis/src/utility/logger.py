@@ -1,26 +1,78 @@
 import os
+import atexit
 import logging
+import queue
+import threading
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
-def setup_logger(logger_name):
+_configured_loggers = {}
+_configure_lock = threading.Lock()
+
+def setup_logger(logger_name, max_bytes=10 * 1024 * 1024, backup_count=5):
     """
-    This function creates a seprate folder for each day and within each day creates all log files that are run on that day
+    This function creates a seprate folder for each day and within it one log file per logger, rotated by size.
+    Each logger is configured once: records go through a QueueHandler to a background QueueListener
+    that does the file I/O, so logging never blocks the calling thread. Calling it again for the same
+    logger returns it unchanged, unless the day changed or its log file was removed.
     Args:
         logger_name(str) : The name of logger
+        max_bytes(int) : Size at which the log file is rotated
+        backup_count(int) : Number of rotated files kept
     Returns:
         logging.Logger: logger instance that is configured
     """
     current_date = datetime.now().strftime("%Y%m%d")
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_directory = os.path.join("logs", current_date)
-    os.makedirs(log_directory, exist_ok=True)
+    log_file = os.path.join(log_directory, f"{logger_name}_{current_date}.log")
+    logger = logging.getLogger(logger_name)
+
+    with _configure_lock:
+        configured = _configured_loggers.get(logger_name)
+        if configured is not None:
+            if configured['log_file'] == log_file and os.path.exists(log_file):
+                return logger
+            _teardown(logger, configured)
 
-    logger= logging.getLogger(logger_name)
-    logger.setLevel(logging.INFO)
-    log_file = os.path.join(log_directory,f"{logger_name}_{timestamp}.log")
-    file_handler = logging.FileHandler(log_file)
-    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-    file_handler.setFormatter(formatter)
+        os.makedirs(log_directory, exist_ok=True)
+        logger.setLevel(logging.INFO)
+        file_handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count)
+        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        file_handler.setFormatter(formatter)
 
-    logger.addHandler(file_handler)
+        log_queue = queue.Queue()
+        queue_handler = QueueHandler(log_queue)
+        listener = QueueListener(log_queue, file_handler)
+        listener.start()
+
+        logger.addHandler(queue_handler)
+        _configured_loggers[logger_name] = {
+            'log_file': log_file,
+            'queue': log_queue,
+            'queue_handler': queue_handler,
+            'file_handler': file_handler,
+            'listener': listener,
+        }
     return logger
+
+def flush_logs():
+    """
+    Block until every queued log record has been written to its file.
+    """
+    with _configure_lock:
+        configured_loggers = list(_configured_loggers.values())
+    for configured in configured_loggers:
+        configured['queue'].join()
+        configured['file_handler'].flush()
+
+def _teardown(logger, configured):
+    logger.removeHandler(configured['queue_handler'])
+    configured['listener'].stop()
+    configured['file_handler'].close()
+
+@atexit.register
+def _stop_listeners():
+    with _configure_lock:
+        for logger_name, configured in list(_configured_loggers.items()):
+            _teardown(logging.getLogger(logger_name), configured)
+        _configured_loggers.clear()
@@ -0,0 +1,192 @@
+import cProfile
+import functools
+import json
+import pstats
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+class MetricsRegistry:
+    """
+    Collect timings and counters from the pipeline hot paths and export them as JSON lines
+    or in the Prometheus text format.
+    Every measurement is kept as a structured event (up to `max_events`) and folded into
+    per-(name, labels) summaries.
+    """
+    def __init__(self, prefix='guardian', max_events=100000):
+        self.prefix = prefix
+        self._events = deque(maxlen=max_events)
+        self._timers = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """
+        Time the enclosed block and record it under `name`.
+        Args:
+            name (str): The metric name, e.g. 'guardian_page_request'.
+            **labels: Extra dimensions such as `page` or `method`.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def observe(self, name, seconds, **labels):
+        """
+        Record a duration in seconds.
+        """
+        key = (name, self._label_key(labels))
+        with self._lock:
+            self._events.append({'type': 'timer', 'name': name, 'labels': labels, 'seconds': seconds, 'timestamp': time.time()})
+            summary = self._timers.setdefault(key, {'count': 0, 'sum': 0.0, 'min': seconds, 'max': seconds})
+            summary['count'] += 1
+            summary['sum'] += seconds
+            summary['min'] = min(summary['min'], seconds)
+            summary['max'] = max(summary['max'], seconds)
+
+    def increment(self, name, value=1, **labels):
+        """
+        Add `value` to the counter `name`, e.g. retries or bytes downloaded.
+        """
+        key = (name, self._label_key(labels))
+        with self._lock:
+            self._events.append({'type': 'counter', 'name': name, 'labels': labels, 'value': value, 'timestamp': time.time()})
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def summary(self):
+        """
+        Returns:
+            dict: {'timers': {...}, 'counters': {...}} keyed by 'name{label="value"}'.
+        """
+        with self._lock:
+            return {
+                'timers': {self._series(name, labels): dict(values) for (name, labels), values in self._timers.items()},
+                'counters': {self._series(name, labels): value for (name, labels), value in self._counters.items()},
+            }
+
+    def export_jsonl(self, path):
+        """
+        Append the buffered events to `path` as JSON lines and clear the buffer.
+        """
+        with self._lock:
+            events = list(self._events)
+            self._events.clear()
+        with open(path, "a") as file:
+            for event in events:
+                file.write(json.dumps(event, default=str) + "\n")
+
+    def export_prometheus(self, path):
+        """
+        Write the summaries to `path` in the Prometheus text exposition format, e.g. for the
+        node_exporter textfile collector.
+        """
+        lines = []
+        with self._lock:
+            timers = sorted(self._timers.items())
+            counters = sorted(self._counters.items())
+
+        for metric in sorted({name for (name, _), _ in timers}):
+            metric_name = self._metric_name(metric, "seconds")
+            lines.append(f"# TYPE {metric_name} summary")
+            for (name, labels), values in timers:
+                if name == metric:
+                    lines.append(f"{metric_name}_sum{self._render_labels(labels)} {values['sum']:.6f}")
+                    lines.append(f"{metric_name}_count{self._render_labels(labels)} {values['count']}")
+        for metric in sorted({name for (name, _), _ in counters}):
+            metric_name = self._metric_name(metric, "total")
+            lines.append(f"# TYPE {metric_name} counter")
+            for (name, labels), value in counters:
+                if name == metric:
+                    lines.append(f"{metric_name}{self._render_labels(labels)} {value}")
+
+        with open(path, "w") as file:
+            file.write("\n".join(lines) + "\n")
+
+    def reset(self):
+        with self._lock:
+            self._events.clear()
+            self._timers.clear()
+            self._counters.clear()
+
+    def _metric_name(self, name, suffix):
+        return re.sub(r"[^a-zA-Z0-9_]", "_", f"{self.prefix}_{name}_{suffix}")
+
+    @staticmethod
+    def _label_key(labels):
+        return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+    @staticmethod
+    def _render_labels(label_key):
+        if not label_key:
+            return ""
+        rendered = ",".join(
+            name + '="' + value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+            for name, value in label_key
+        )
+        return "{" + rendered + "}"
+
+    def _series(self, name, label_key):
+        return f"{name}{self._render_labels(label_key)}"
+
+
+metrics = MetricsRegistry()
+
+def timed(name=None, registry=None):
+    """
+    Decorator recording the duration of every call of a function or method.
+    Args:
+        name (str, optional): The metric name. Defaults to 'call'.
+        registry (MetricsRegistry, optional): Defaults to the module-level `metrics`.
+    The decorated function's qualified name is recorded as the `method` label.
+    """
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with (registry or metrics).timer(name or 'call', method=function.__qualname__):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+@contextmanager
+def profile(output_path=None, backend='cprofile'):
+    """
+    Profile the enclosed block.
+    Args:
+        output_path (str, optional): Where to write the report: pstats data for 'cprofile',
+            HTML for 'pyinstrument'. When None the top functions are printed.
+        backend (str, optional): 'cprofile', or 'pyinstrument' when it is installed. Defaults to 'cprofile'.
+    """
+    if backend == 'pyinstrument':
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            raise ImportError("The 'pyinstrument' backend requires `pip install pyinstrument`.") from None
+        profiler = Profiler()
+        profiler.start()
+        try:
+            yield profiler
+        finally:
+            profiler.stop()
+            if output_path:
+                with open(output_path, "w") as file:
+                    file.write(profiler.output_html())
+            else:
+                print(profiler.output_text())
+    elif backend == 'cprofile':
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield profiler
+        finally:
+            profiler.disable()
+            if output_path:
+                profiler.dump_stats(output_path)
+            else:
+                pstats.Stats(profiler).sort_stats('cumulative').print_stats(20)
+    else:
+        raise ValueError("Invalid backend value. Allowed values are 'cprofile' or 'pyinstrument'.")
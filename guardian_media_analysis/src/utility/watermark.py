@@ -0,0 +1,102 @@
+import glob
+import json
+import os
+import re
+import threading
+import uuid
+from datetime import datetime, timezone
+from .fetch_config import fetch_config
+from .date_windows import merge_results
+
+_locks = {}
+_locks_guard = threading.Lock()
+
+def _lock_for(path):
+    with _locks_guard:
+        return _locks.setdefault(os.path.abspath(path), threading.Lock())
+
+class WatermarkStore:
+    """
+    Persist, per search query, the latest article already ingested together with the raw results
+    of every run, so later runs only have to request and write the delta. Each run appends its
+    own results file; `load_results` assembles the full history only when asked for.
+    """
+    def __init__(self, state_dir=None):
+        if state_dir is None:
+            _, config_path = fetch_config()
+            state_dir = os.path.dirname(config_path)
+        self.state_path = os.path.join(state_dir, "extraction_state.json")
+        self.results_dir = os.path.join(state_dir, "extracted")
+        self._lock = _lock_for(self.state_path)
+
+    def get(self, search_query):
+        """
+        Retrieve the high-water mark recorded for a query.
+        Returns:
+            dict: {'webPublicationDate': ..., 'id': ...}, or None when the query was never ingested.
+        """
+        return self._read_state().get(search_query)
+
+    def update(self, search_query, results):
+        """
+        Move the high-water mark of a query forward to the newest article in `results`.
+        Returns:
+            dict: The mark now stored for the query.
+        """
+        with self._lock:
+            state = self._read_state()
+            mark = state.get(search_query)
+            for result in results:
+                published = result.get('webPublicationDate')
+                if published and (mark is None or published > mark['webPublicationDate']):
+                    mark = {'webPublicationDate': published, 'id': result.get('id')}
+            if mark is not None:
+                state[search_query] = mark
+                self._write_json(self.state_path, state)
+            return mark
+
+    def load_results(self, search_query):
+        """
+        Load the raw results stored for a query across all runs. When a later run fetched an
+        article again, its newer copy wins.
+        Returns:
+            list: The stored result dicts ordered by publication date, empty when nothing was stored yet.
+        """
+        runs = []
+        for path in sorted(glob.glob(os.path.join(self._results_dir(search_query), "run-*.json")), reverse=True):
+            with open(path, "r") as file:
+                runs.append(json.load(file))
+        results = merge_results(runs)
+        results.sort(key=lambda result: result.get('webPublicationDate', ''))
+        return results
+
+    def append_results(self, search_query, results):
+        """
+        Write the results of one run to their own file, leaving earlier runs untouched.
+        Returns:
+            str: The path of the written file, or None when `results` is empty.
+        """
+        if not results:
+            return None
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        path = os.path.join(self._results_dir(search_query), f"run-{timestamp}-{uuid.uuid4().hex[:8]}.json")
+        self._write_json(path, results)
+        return path
+
+    def _results_dir(self, search_query):
+        slug = re.sub(r"[^a-z0-9]+", "_", search_query.lower()).strip("_")
+        return os.path.join(self.results_dir, slug)
+
+    def _read_state(self):
+        if not os.path.exists(self.state_path):
+            return {}
+        with open(self.state_path, "r") as file:
+            return json.load(file)
+
+    @staticmethod
+    def _write_json(path, payload):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as file:
+            json.dump(payload, file)
+        os.replace(tmp_path, path)
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.transformation_analysis import (GlobalZScoreDetector, RollingZScoreDetector, RobustZScoreDetector,
+                                         SeasonalZScoreDetector, get_detector, DataProcessor)
+
+
+def daily_counts(values, start="2018-01-01"):
+    return pd.DataFrame({'Date': pd.date_range(start, periods=len(values), freq='D'), 'No_of_articles': values})
+
+@pytest.fixture
+def quiet_then_busy():
+    # a quiet first half with one local spike, then a busy era
+    values = [1, 2, 1, 2] * 15 + [9] + [1, 2] * 10 + [20, 22] * 30
+    return daily_counts(values)
+
+def test_global_detector_matches_plain_z_score(quiet_then_busy):
+    scored = GlobalZScoreDetector(threshold=2).detect(quiet_then_busy)
+    values = quiet_then_busy['No_of_articles']
+    expected = (np.abs(values - np.mean(values)) > 2 * np.std(values)).to_numpy()
+    assert (scored['is_unusual'].to_numpy() == expected).all()
+    assert not scored.loc[60, 'is_unusual']
+
+def test_rolling_and_robust_detectors_catch_local_spike(quiet_then_busy):
+    for detector in (RollingZScoreDetector(threshold=3), RobustZScoreDetector()):
+        scored = detector.detect(quiet_then_busy)
+        assert scored.loc[60, 'is_unusual']
+        assert not scored.loc[100:, 'is_unusual'].any()
+
+def test_seasonal_detector_ignores_weekly_pattern():
+    weeks = [10, 10, 10, 10, 10, 2, 2] * 12
+    weeks[-3] = 30
+    scored = SeasonalZScoreDetector().detect(daily_counts(weeks, start="2024-01-01"))
+    assert list(scored.index[scored['is_unusual']]) == [len(weeks) - 3]
+
+@pytest.mark.parametrize("name", ["global", "rolling", "robust", "seasonal"])
+def test_update_matches_full_detection(name, quiet_then_busy):
+    full = get_detector(name).detect(quiet_then_busy)
+    detector = get_detector(name)
+    detector.detect(quiet_then_busy.iloc[:70])
+    head = detector.update(quiet_then_busy.iloc[70:100])
+    tail = detector.update(quiet_then_busy.iloc[100:])
+    if name == "global":
+        assert detector.update(quiet_then_busy.iloc[0:0]).empty
+        assert tail['baseline'].iloc[-1] == pytest.approx(full['baseline'].iloc[-1])
+        assert tail['spread'].iloc[-1] == pytest.approx(full['spread'].iloc[-1])
+    else:
+        incremental = pd.concat([head, tail], ignore_index=True)
+        np.testing.assert_allclose(incremental['score'], full['score'].iloc[70:], equal_nan=True)
+
+@pytest.mark.parametrize("name", ['rolling', 'robust', 'seasonal'])
+def test_sparse_counts_are_not_flagged_on_flat_baselines(name):
+    # Poisson noise with no real events: most trailing windows are all zeros
+    values = np.random.default_rng(0).poisson(0.3, 2000)
+    scored = get_detector(name).detect(daily_counts(values))
+    assert np.isfinite(scored['score'].dropna()).all()
+    assert scored['is_unusual'].sum() < 20
+    assert not scored.loc[scored['No_of_articles'] == scored['baseline'], 'is_unusual'].any()
+
+def test_unknown_detector_is_rejected():
+    with pytest.raises(ValueError):
+        get_detector("prophet")
+
+def test_data_processor_accepts_detector_name(quiet_then_busy):
+    processor = DataProcessor()
+    unusual = processor.get_unusual_events(quiet_then_busy, threshold=3, detector='rolling')
+    assert pd.Timestamp("2018-03-02") in list(unusual['Date'])
+
+def test_detector_default_threshold_is_kept(monkeypatch):
+    used = []
+    original = RobustZScoreDetector.detect
+    monkeypatch.setattr(RobustZScoreDetector, "detect", lambda self, *args: used.append(self.threshold) or original(self, *args))
+    counts = daily_counts([1, 2] * 40)
+    DataProcessor().get_unusual_events(counts, detector='robust')
+    DataProcessor().get_unusual_events(counts, threshold=5, detector='robust')
+    assert used == [3.5, 5]
@@ -1,6 +1,7 @@
 import pytest
-from src.api_extarction import GuardianAPI
+from src.api_extarction import GuardianAPI, SearchQuery
 import json
+import os
 import requests
 import requests_mock
 from datetime import datetime
@@ -66,4 +67,238 @@ def test_rate_limit_handling(guardian_api):
             search_query = "Justin Trudeau"
             from_date = "2018-01-01"
             to_date = datetime.now().strftime("%Y-%m-%d")
-            guardian_api.guardian_search(search_query, from_date, to_date)
\ No newline at end of file
+            guardian_api.guardian_search(search_query, from_date, to_date)
+
+def paged_response(total_pages, page_size=2):
+    """Build a requests-mock callback serving `total_pages` pages of synthetic articles."""
+    def callback(request, context):
+        page = int(request.qs['page'][0])
+        return {
+            "response": {
+                "status": "ok",
+                "pages": total_pages,
+                "currentPage": page,
+                "results": [
+                    {"id": f"article-{page}-{i}", "webTitle": f"Justin Trudeau page {page} item {i}"}
+                    for i in range(page_size)
+                ]
+            }
+        }
+    return callback
+
+def test_concurrent_fetch_keeps_page_order(guardian_api):
+    """Test that concurrent fetching returns the same results, in page order, as sequential fetching."""
+    with requests_mock.Mocker() as m:
+        m.get("http://content.guardianapis.com/search", json=paged_response(total_pages=6))
+        sequential = guardian_api.guardian_search("Justin Trudeau", "2018-01-01", "2019-12-31")
+        concurrent = guardian_api.guardian_search("Justin Trudeau", "2018-01-01", "2019-12-31", max_workers=4)
+        assert concurrent == sequential
+        assert [article['id'] for article in concurrent[:4]] == ["article-1-0", "article-1-1", "article-2-0", "article-2-1"]
+        assert len(concurrent) == 12
+
+def test_concurrent_fetch_retries_failed_page(guardian_api, monkeypatch):
+    """Test that a transient failure on one page is retried without disturbing the other pages."""
+    monkeypatch.setattr("src.api_extarction.api_extraction.time.sleep", lambda seconds: None)
+    callback = paged_response(total_pages=3)
+    failures = {"remaining": 1}
+
+    def flaky(request, context):
+        if request.qs['page'][0] == '2' and failures["remaining"]:
+            failures["remaining"] -= 1
+            context.status_code = 500
+            return {}
+        return callback(request, context)
+
+    with requests_mock.Mocker() as m:
+        m.get("http://content.guardianapis.com/search", json=flaky)
+        articles = guardian_api.guardian_search("Justin Trudeau", "2018-01-01", "2019-12-31", max_workers=3)
+        assert [article['id'] for article in articles] == [
+            f"article-{page}-{i}" for page in range(1, 4) for i in range(2)
+        ]
+
+def window_response(request, context):
+    """Serve one article per window plus an article that appears in every window."""
+    from_date = request.qs['from-date'][0]
+    return {
+        "response": {
+            "status": "ok",
+            "pages": 1,
+            "total": 2,
+            "results": [
+                {"id": f"article-{from_date}", "webTitle": "Justin Trudeau"},
+                {"id": "boundary-article", "webTitle": "Justin Trudeau"}
+            ]
+        }
+    }
+
+def test_sharded_search_merges_windows(guardian_api):
+    """Test that a sharded search covers every window and drops duplicate article ids."""
+    with requests_mock.Mocker() as m:
+        m.get("http://content.guardianapis.com/search", json=window_response)
+        articles = guardian_api.guardian_search_sharded("Justin Trudeau", "2018-01-01", "2018-03-31", window='month')
+        assert [article['id'] for article in articles] == [
+            "article-2018-01-01", "boundary-article", "article-2018-02-01", "article-2018-03-01"
+        ]
+
+def test_adaptive_sharding_splits_dense_windows(guardian_api):
+    """Test that adaptive windows are halved until each one fits the result budget."""
+    def dense_response(request, context):
+        from_date = datetime.strptime(request.qs['from-date'][0], "%Y-%m-%d")
+        to_date = datetime.strptime(request.qs['to-date'][0], "%Y-%m-%d")
+        return {"response": {"status": "ok", "pages": 1, "total": ((to_date - from_date).days + 1) * 10,
+                             "results": [{"id": f"article-{request.qs['from-date'][0]}"}]}}
+
+    with requests_mock.Mocker() as m:
+        m.get("http://content.guardianapis.com/search", json=dense_response)
+        articles = guardian_api.guardian_search_sharded("Justin Trudeau", "2018-01-01", "2018-01-31",
+                                                        window='adaptive', max_results_per_window=100)
+        searched = [r.qs for r in m.request_history if r.qs['page-size'] == ['100']]
+        assert len(articles) == len(searched) == 4
+        assert all(len(article['id']) == len("article-2018-01-01") for article in articles)
+
+def test_adaptive_probes_run_concurrently(guardian_api, monkeypatch):
+    """Test that the one-result probes of adaptive sharding share the worker pool."""
+    import threading, time
+    in_flight, peak, probed, lock = [0], [0], [], threading.Lock()
+
+    def slow_probe(search_query, from_date, to_date, max_retries):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            probed.append(from_date)
+        time.sleep(0.05)
+        with lock:
+            in_flight[0] -= 1
+        return 10
+
+    monkeypatch.setattr(guardian_api, "_probe_total", slow_probe)
+    monkeypatch.setattr(guardian_api, "_collect_pages", lambda *args: [])
+    guardian_api.guardian_search_sharded("Justin Trudeau", "2018-01-01", "2018-12-31",
+                                         window='adaptive', max_workers=6, max_results_per_window=100)
+    assert len(probed) == 12
+    assert peak[0] > 1
+
+def test_incremental_search_requests_only_delta(guardian_api, tmp_path):
+    """Test that a second incremental run resumes from the high-water mark and merges with stored results."""
+    from src.utility import WatermarkStore
+    store = WatermarkStore(str(tmp_path))
+    first_run = {"response": {"status": "ok", "pages": 1, "results": [
+        {"id": "a", "webTitle": "Old", "webPublicationDate": "2020-01-01T10:00:00Z"},
+        {"id": "b", "webTitle": "Justin Trudeau", "webPublicationDate": "2020-03-10T10:00:00Z"}
+    ]}}
+    second_run = {"response": {"status": "ok", "pages": 1, "results": [
+        {"id": "b", "webTitle": "Justin Trudeau (updated)", "webPublicationDate": "2020-03-10T10:00:00Z"},
+        {"id": "c", "webTitle": "New", "webPublicationDate": "2020-03-12T08:00:00Z"}
+    ]}}
+
+    with requests_mock.Mocker() as m:
+        m.get("http://content.guardianapis.com/search", json=first_run)
+        guardian_api.incremental_search("Justin Trudeau", "2018-01-01", "2020-03-10", watermark_store=store)
+        m.get("http://content.guardianapis.com/search", json=second_run)
+        new_articles = guardian_api.incremental_search("Justin Trudeau", "2018-01-01", "2020-03-12", watermark_store=store)
+        assert m.last_request.qs['from-date'] == ["2020-03-08"]
+
+    assert [article['id'] for article in new_articles] == ["b", "c"]
+    state_key = SearchQuery("Justin Trudeau").state_key()
+    assert len(os.listdir(os.path.join(tmp_path, "extracted", state_key))) == 2
+    articles = store.load_results(state_key)
+    assert [article['id'] for article in articles] == ["a", "b", "c"]
+    assert articles[1]['webTitle'] == "Justin Trudeau (updated)"
+    assert store.get(state_key) == {"webPublicationDate": "2020-03-12T08:00:00Z", "id": "c"}
+
+def test_incremental_search_upserts_into_article_store(guardian_api, tmp_path):
+    """Test that an article store replaces the per-run result files."""
+    from src.storage import ArticleStore
+    from src.utility import WatermarkStore
+    response = {"response": {"status": "ok", "pages": 1, "results": [
+        {"id": "a", "type": "article", "webTitle": "Justin Trudeau", "webPublicationDate": "2020-01-01T10:00:00Z"}
+    ]}}
+    with requests_mock.Mocker() as m, ArticleStore(str(tmp_path / "articles.duckdb")) as article_store:
+        m.get("http://content.guardianapis.com/search", json=response)
+        guardian_api.incremental_search("Justin Trudeau", "2018-01-01", "2020-03-10",
+                                        watermark_store=WatermarkStore(str(tmp_path)), article_store=article_store)
+        assert article_store.count() == 1
+    assert not os.path.exists(tmp_path / "extracted")
+
+def test_watermark_updates_from_separate_stores_do_not_collide(tmp_path):
+    """Test that concurrent updates through different store instances keep the newest mark."""
+    from concurrent.futures import ThreadPoolExecutor
+    from src.utility import WatermarkStore
+    results = [[{"id": f"article-{day:02d}", "webPublicationDate": f"2020-01-{day:02d}T00:00:00Z"}] for day in range(1, 29)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda batch: WatermarkStore(str(tmp_path)).update("trudeau", batch), results))
+    assert WatermarkStore(str(tmp_path)).get("trudeau")['id'] == "article-28"
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+def test_batch_search_shares_one_worker_pool(guardian_api):
+    """Test that several queries are fetched together and their results stay keyed by query."""
+    def query_response(request, context):
+        query = request.qs['q'][0].replace('%20', ' ')
+        page = int(request.qs['page'][0])
+        return {"response": {"status": "ok", "pages": 2, "results": [
+            {"id": f"{query}-{page}", "webTitle": f"{query} article {page}", "type": "article",
+             "webPublicationDate": "2019-10-22T06:00:00Z"}
+        ]}}
+
+    with requests_mock.Mocker() as m:
+        m.get("http://content.guardianapis.com/search", json=query_response)
+        batch = guardian_api.batch_search(["Justin Trudeau", "Jagmeet Singh", "Justin Trudeau"],
+                                          "2019-01-01", "2019-12-31", max_workers=3)
+        df = guardian_api.batch_to_dataframe(batch)
+
+    assert list(batch) == ["Justin Trudeau", "Jagmeet Singh"]
+    assert [article['id'] for article in batch["Jagmeet Singh"]] == ["jagmeet singh-1", "jagmeet singh-2"]
+    assert len(m.request_history) == 4
+    assert df.groupby('query', observed=True).size().to_dict() == {"Jagmeet Singh": 2, "Justin Trudeau": 2}
+
+def test_connection_pool_only_grows(guardian_api):
+    """Test that the session pool is resized once for more workers and kept for fewer."""
+    guardian_api._resize_connection_pool(16)
+    adapter = guardian_api.session.get_adapter('https://')
+    guardian_api._resize_connection_pool(2)
+    guardian_api._resize_connection_pool(16)
+    assert guardian_api.session.get_adapter('https://') is adapter
+    assert guardian_api.session.get_adapter('http://') is adapter
+    assert guardian_api._pool_size == 16
+
+def test_resumable_crawl_restarts_from_checkpoint(guardian_api, tmp_path):
+    """Test that a failed resumable crawl keeps its pages and a rerun only fetches the missing ones."""
+    guardian_api.checkpoint_dir = str(tmp_path)
+    callback = paged_response(total_pages=3)
+
+    def failing_last_page(request, context):
+        if request.qs['page'][0] == '3':
+            context.status_code = 500
+            return {}
+        return callback(request, context)
+
+    with requests_mock.Mocker() as m:
+        m.get("http://content.guardianapis.com/search", json=failing_last_page)
+        with pytest.raises(Exception):
+            guardian_api.guardian_search("Justin Trudeau", "2018-01-01", "2019-12-31", max_retries=0, resumable=True)
+
+    checkpoint = guardian_api._checkpoint("Justin Trudeau", "2018-01-01", "2019-12-31")
+    assert checkpoint.cursor()['completed_pages'] == [1, 2]
+    assert checkpoint.cursor()['total_pages'] == 3
+
+    with requests_mock.Mocker() as m:
+        m.get("http://content.guardianapis.com/search", json=callback)
+        articles = guardian_api.guardian_search("Justin Trudeau", "2018-01-01", "2019-12-31", resumable=True)
+        assert [r.qs['page'] for r in m.request_history] == [['1'], ['3']]
+
+    assert [article['id'] for article in articles] == [f"article-{page}-{i}" for page in range(1, 4) for i in range(2)]
+    assert not os.path.exists(checkpoint.path)
+
+def test_stale_checkpoint_is_discarded(guardian_api, tmp_path):
+    """Test that a checkpoint whose page layout no longer matches the API is not resumed from."""
+    guardian_api.checkpoint_dir = str(tmp_path)
+    checkpoint = guardian_api._checkpoint("Justin Trudeau", "2018-01-01", "2019-12-31")
+    for page in (1, 2):
+        checkpoint.save_page(page, {"response": {"pages": 2, "results": [{"id": f"stale-{page}"}]}})
+
+    with requests_mock.Mocker() as m:
+        m.get("http://content.guardianapis.com/search", json=paged_response(total_pages=3))
+        articles = guardian_api.guardian_search("Justin Trudeau", "2018-01-01", "2019-12-31", resumable=True)
+        assert [r.qs['page'] for r in m.request_history] == [['1'], ['2'], ['3']]
+
+    assert [article['id'] for article in articles] == [f"article-{page}-{i}" for page in range(1, 4) for i in range(2)]
@@ -0,0 +1,93 @@
+import os
+import duckdb
+import pandas as pd
+from src.storage import ArticleStore, flatten_records
+from src.transformation_analysis import DataProcessor
+
+
+def make_article(article_id, published, title="Justin Trudeau", section="World news"):
+    return {
+        "id": article_id,
+        "type": "article",
+        "sectionName": section,
+        "webPublicationDate": published,
+        "webTitle": title,
+        "fields": {"headline": title, "byline": "Reporter"}
+    }
+
+def test_upsert_replaces_articles_with_same_id(tmp_path):
+    db_path = str(tmp_path / "articles.duckdb")
+    with ArticleStore(db_path) as store:
+        store.upsert([make_article("a", "2019-10-21T10:00:00Z"), make_article("b", "2019-10-22T10:00:00Z")])
+        store.upsert([make_article("b", "2019-10-22T10:00:00Z", title="Updated"), make_article("c", "2020-01-05T10:00:00Z")])
+
+    with ArticleStore(db_path, read_only=True) as store:
+        articles = store.to_dataframe()
+    assert list(articles['id']) == ["a", "b", "c"]
+    assert articles.loc[articles['id'] == "b", 'headline'].item() == "Updated"
+
+def test_export_parquet_partitions_by_year_and_month(tmp_path):
+    with ArticleStore(str(tmp_path / "articles.duckdb")) as store:
+        store.upsert([make_article("a", "2019-10-21T10:00:00Z"), make_article("b", "2020-01-05T10:00:00Z")])
+        store.export_parquet(str(tmp_path / "parquet"))
+
+    assert os.path.isdir(tmp_path / "parquet" / "year=2019" / "month=10")
+    assert os.path.isdir(tmp_path / "parquet" / "year=2020" / "month=1")
+    count = duckdb.connect().execute(
+        f"SELECT count(*) FROM read_parquet('{tmp_path}/parquet/**/*.parquet', hive_partitioning = true)"
+    ).fetchone()[0]
+    assert count == 2
+
+def test_data_processor_reads_from_store(tmp_path):
+    with ArticleStore(str(tmp_path / "articles.duckdb")) as store:
+        store.upsert([
+            make_article("a", "2019-10-21T10:00:00Z"),
+            make_article("b", "2019-10-22T10:00:00Z", section="Politics"),
+            make_article("c", "2019-10-22T12:00:00Z")
+        ])
+        processor = DataProcessor.from_store(store)
+        top_sections = processor.get_top_section()
+        assert list(top_sections['sectionName']) == ["World news", "Politics"]
+        assert processor.get_total_article_count() == 2
+        assert sorted(processor.df['id']) == ["a", "b", "c"]
+
+def test_articles_are_tagged_by_query(tmp_path):
+    with ArticleStore(str(tmp_path / "articles.duckdb")) as store:
+        store.upsert([make_article("a", "2019-10-21T10:00:00Z"), make_article("b", "2019-10-22T10:00:00Z")],
+                     query="Justin Trudeau")
+        store.upsert([make_article("b", "2019-10-22T10:00:00Z")], query="Jagmeet Singh")
+        processor = DataProcessor.from_store(store, table='query_articles')
+        sections = processor.get_top_section_by_query()
+        assert sections.set_index('query')['section_count'].to_dict() == {"Jagmeet Singh": 1, "Justin Trudeau": 2}
+        assert store.count() == 2
+
+def test_rollup_refreshes_affected_days(tmp_path):
+    with ArticleStore(str(tmp_path / "articles.duckdb")) as store:
+        store.upsert([make_article("a", "2019-10-21T10:00:00Z"), make_article("b", "2019-10-21T12:00:00Z")])
+        # "b" is re-published a day later and "c" arrives
+        store.upsert([make_article("b", "2019-10-22T10:00:00Z"), make_article("c", "2019-10-22T11:00:00Z", section="Politics")])
+        rollup = store.query("SELECT day::varchar AS day, sectionName, article_count FROM daily_counts ORDER BY ALL")
+        assert rollup.values.tolist() == [
+            ["2019-10-21", "World news", 1], ["2019-10-22", "Politics", 1], ["2019-10-22", "World news", 1]
+        ]
+        store.con.execute("DELETE FROM daily_counts")
+        store.rebuild_rollup()
+        assert store.query("SELECT sum(article_count) AS n FROM daily_counts")['n'].item() == 3
+
+def test_store_processor_serves_counts_from_rollup(tmp_path):
+    articles = [make_article("a", "2018-02-21T10:00:00Z"), make_article("b", "2018-02-26T12:00:00Z"),
+                make_article("c", "2019-10-22T11:00:00Z", section="Politics")]
+    in_memory = DataProcessor(flatten_records(articles))
+    with ArticleStore(str(tmp_path / "articles.duckdb")) as store:
+        store.upsert(articles)
+        processor = DataProcessor.from_store(store)
+        assert processor.rollup_table == 'daily_counts'
+        for group_by in ('day', 'week', 'month', 'year'):
+            assert processor.get_article_counts(group_by).equals(in_memory.get_article_counts(group_by))
+        assert processor.get_trudeau_articles_count()[0].equals(in_memory.get_trudeau_articles_count()[0])
+        assert processor.get_top_section().equals(in_memory.get_top_section())
+        assert processor.get_total_article_count() == in_memory.get_total_article_count() == 3
+
+    weeks = in_memory.get_article_counts('week')
+    assert weeks.loc[weeks['Date'] == pd.Timestamp("2018-02-19"), 'No_of_articles'].item() == 1
+    assert weeks.loc[weeks['Date'] == pd.Timestamp("2018-02-26"), 'No_of_articles'].item() == 1
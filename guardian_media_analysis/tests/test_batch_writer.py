@@ -0,0 +1,44 @@
+import os
+import duckdb
+import requests_mock
+from src.api_extarction import GuardianAPI
+from src.storage import ParquetBatchWriter
+
+
+def page_callback(request, context):
+    page = int(request.qs['page'][0])
+    return {
+        "response": {
+            "status": "ok",
+            "pages": 3,
+            "results": [
+                {
+                    "id": f"article-{page}-{i}",
+                    "type": "article",
+                    "sectionName": "World news",
+                    "webPublicationDate": f"2019-10-{10 + page}T12:00:00Z",
+                    "webTitle": f"Justin Trudeau {page}-{i}",
+                    "fields": {"headline": f"Headline {page}-{i}", "byline": "Reporter"}
+                }
+                for i in range(4)
+            ]
+        }
+    }
+
+def test_streamed_pages_are_flushed_to_parquet(tmp_path):
+    guardian_api = GuardianAPI()
+    with requests_mock.Mocker() as m:
+        m.get("http://content.guardianapis.com/search", json=page_callback)
+        with ParquetBatchWriter(str(tmp_path), batch_size=5) as writer:
+            for page in guardian_api.iter_search_pages("Justin Trudeau", "2019-01-01", "2019-12-31", max_workers=2):
+                writer.write(page)
+
+    assert writer.rows_written == 12
+    assert sorted(os.listdir(str(tmp_path))) == [f"part-{part:05d}.parquet" for part in range(3)]
+    rows = duckdb.connect().execute(f"""
+        SELECT id, headline, typeof(webPublicationDate)
+        FROM read_parquet('{tmp_path}/*.parquet')
+        ORDER BY id
+    """).fetchall()
+    assert len(rows) == 12
+    assert rows[0] == ("article-1-0", "Headline 1-0", "TIMESTAMP")
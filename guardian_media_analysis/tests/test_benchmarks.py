@@ -0,0 +1,28 @@
+from src.api_extarction import GuardianAPI, TokenBucket
+from benchmarks.synthetic_corpus import generate_results, page_payload
+from benchmarks.mock_server import MockGuardianServer
+from benchmarks.run_benchmarks import save_results, compare_with_previous
+
+
+def test_synthetic_corpus_is_guardian_shaped_and_deterministic():
+    results = generate_results(250, seed=1)
+    assert results == generate_results(250, seed=1)
+    assert len({result['id'] for result in results}) == 250
+    assert {'id', 'type', 'sectionName', 'webPublicationDate', 'webTitle', 'fields'} <= set(results[0])
+    assert page_payload(results, 3)['response']['pages'] == 3
+    assert len(page_payload(results, 3)['response']['results']) == 50
+
+def test_mock_server_serves_every_page():
+    results = generate_results(250)
+    guardian_api = GuardianAPI(rate_limiter=TokenBucket(rate=1e9))
+    with MockGuardianServer(results) as server:
+        guardian_api.SEARCH_URL = server.url
+        fetched = guardian_api.guardian_search("Justin Trudeau", "2018-01-01", "2024-12-31", max_workers=2)
+    assert fetched == results
+    assert server.request_count == 3
+
+def test_regressions_are_reported_against_previous_run(tmp_path):
+    save_results({'report': {'median': 1.0, 'min': 1.0, 'mean': 1.0, 'runs': 1}}, str(tmp_path))
+    (tmp_path / sorted(p.name for p in tmp_path.iterdir())[0]).rename(tmp_path / "00000000_000000_old.json")
+    path = save_results({'report': {'median': 1.5, 'min': 1.5, 'mean': 1.5, 'runs': 1}}, str(tmp_path))
+    assert compare_with_previous(path) == [('report', 1.0, 1.5)]
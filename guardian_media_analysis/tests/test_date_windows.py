@@ -0,0 +1,32 @@
+import pytest
+from src.utility import split_date_range, bisect_date_range, merge_results
+
+
+def test_split_by_month():
+    assert split_date_range("2018-01-15", "2018-03-10") == [
+        ("2018-01-15", "2018-01-31"),
+        ("2018-02-01", "2018-02-28"),
+        ("2018-03-01", "2018-03-10"),
+    ]
+
+def test_split_by_week():
+    # 2024-01-03 is a Wednesday, so the first window ends on Sunday 2024-01-07
+    assert split_date_range("2024-01-03", "2024-01-16", window="week") == [
+        ("2024-01-03", "2024-01-07"),
+        ("2024-01-08", "2024-01-14"),
+        ("2024-01-15", "2024-01-16"),
+    ]
+
+def test_split_rejects_invalid_input():
+    with pytest.raises(ValueError):
+        split_date_range("2018-02-01", "2018-01-01")
+    with pytest.raises(ValueError):
+        split_date_range("2018-01-01", "2018-02-01", window="fortnight")
+
+def test_bisect_date_range():
+    assert bisect_date_range("2018-01-01", "2018-01-04") == [("2018-01-01", "2018-01-02"), ("2018-01-03", "2018-01-04")]
+    assert bisect_date_range("2018-01-01", "2018-01-01") is None
+
+def test_merge_results_drops_duplicate_ids():
+    merged = merge_results([[{"id": "a"}, {"id": "b"}], [{"id": "b"}, {"id": "c"}]])
+    assert [result["id"] for result in merged] == ["a", "b", "c"]
@@ -0,0 +1,28 @@
+import pandas as pd
+from src.transformation_analysis import HeadlineIndex
+
+
+def make_index():
+    return HeadlineIndex(pd.DataFrame({
+        'webTitle': ["Justin Trudeau wins second term", "Trudeau and Justin Bieber meet",
+                     "Election night: Trudeau, Justin's rival concedes", "Raptors win title"],
+        'headline': ["Canada election result", None, "Canada votes", "Toronto celebrates"],
+        'byline': ["Leyland Cecco", "Staff", "Leyland Cecco", "Sports desk"],
+        'webPublicationDate': pd.to_datetime(["2019-10-22 06:00", "2019-10-22 09:00", "2019-10-23 08:00", "2019-06-14 03:00"]),
+    }))
+
+def test_phrase_and_keyword_search():
+    index = make_index()
+    assert list(index.search('"justin trudeau"')) == [0]
+    assert list(index.search('justin trudeau')) == [0, 1, 2]
+    assert list(index.search('"Justin Trudeau" election')) == [0]
+    assert list(index.search('cecco canada')) == [0, 2]
+    assert list(index.search('"term canada"')) == []
+    assert index.search('prime minister').size == 0
+    assert list(index.filter('raptors')['webTitle']) == ["Raptors win title"]
+
+def test_term_frequency_over_time():
+    frequency = make_index().term_frequency(['trudeau', '"leyland cecco"'], freq='D')
+    assert frequency.loc["2019-10-22", 'trudeau'] == 2
+    assert frequency.loc["2019-10-23", '"leyland cecco"'] == 1
+    assert frequency['trudeau'].sum() == 3
@@ -1,5 +1,5 @@
 import os
-from src.utility import setup_logger
+from src.utility import setup_logger, flush_logs
 from datetime import datetime
 import logging
 
@@ -22,6 +22,7 @@ class TestSetupLogger:
         logger = setup_logger(logger_name)
         test_message = "Test message"
         logger.info(test_message)
+        flush_logs()
         current_date = datetime.now().strftime("%Y%m%d")
         log_directory = os.path.join("logs", current_date)
         log_files = os.listdir(log_directory)
@@ -38,6 +39,7 @@ class TestSetupLogger:
         logger = setup_logger(logger_name)
         logger.warning("Test warning message")
         logger.error("Test error message")
+        flush_logs()
         current_date = datetime.now().strftime("%Y%m%d")
         log_directory = os.path.join("logs", current_date)
         log_files = os.listdir(log_directory)
@@ -56,6 +58,7 @@ class TestSetupLogger:
         assert another_logger.name == another_logger_name
         another_test_message = "Another test message"
         another_logger.info(another_test_message)
+        flush_logs()
         current_date = datetime.now().strftime("%Y%m%d")
         log_directory = os.path.join("logs", current_date)
         log_files = os.listdir(log_directory)
@@ -65,6 +68,21 @@ class TestSetupLogger:
             content = file.read()
             assert another_test_message in content
 
+    def test_logger_is_configured_once(self):
+        logger_name = "test_logger"
+        logger = setup_logger(logger_name)
+        handler_count = len(logger.handlers)
+        logger = setup_logger(logger_name)
+        assert len(logger.handlers) == handler_count == 1
+        logger.info("Logged once")
+        flush_logs()
+        current_date = datetime.now().strftime("%Y%m%d")
+        log_directory = os.path.join("logs", current_date)
+        log_files = os.listdir(log_directory)
+        assert len(log_files) == 1
+        with open(os.path.join(log_directory, log_files[0]), "r") as file:
+            assert file.read().count("Logged once") == 1
+
     def teardown_method(self, method):
         current_date = datetime.now().strftime("%Y%m%d")
         log_directory = os.path.join("logs", current_date)
@@ -0,0 +1,61 @@
+import json
+import requests_mock
+from src.utility import MetricsRegistry, metrics, timed, profile
+from src.api_extarction import GuardianAPI, TokenBucket
+
+
+def test_timers_and_counters_are_summarised():
+    registry = MetricsRegistry()
+    with registry.timer('page_request', page=1):
+        pass
+    registry.observe('page_request', 0.5, page=1)
+    registry.increment('bytes_downloaded', 100)
+    registry.increment('bytes_downloaded', 50)
+
+    summary = registry.summary()
+    assert summary['timers']['page_request{page="1"}']['count'] == 2
+    assert summary['timers']['page_request{page="1"}']['max'] == 0.5
+    assert summary['counters']['bytes_downloaded'] == 150
+
+def test_exports(tmp_path):
+    registry = MetricsRegistry()
+    registry.observe('dataframe_build', 0.25, method='GuardianAPI.results_to_dataframe')
+    registry.increment('page_retries', status=429)
+
+    registry.export_prometheus(str(tmp_path / "metrics.prom"))
+    prometheus = (tmp_path / "metrics.prom").read_text()
+    assert "# TYPE guardian_dataframe_build_seconds summary" in prometheus
+    assert 'guardian_dataframe_build_seconds_sum{method="GuardianAPI.results_to_dataframe"} 0.250000' in prometheus
+    assert 'guardian_page_retries_total{status="429"} 1' in prometheus
+
+    registry.export_jsonl(str(tmp_path / "metrics.jsonl"))
+    events = [json.loads(line) for line in (tmp_path / "metrics.jsonl").read_text().splitlines()]
+    assert [event['name'] for event in events] == ['dataframe_build', 'page_retries']
+
+def test_timed_decorator_labels_method():
+    registry = MetricsRegistry()
+
+    @timed('analytics', registry=registry)
+    def report():
+        return 42
+
+    assert report() == 42
+    assert registry.summary()['timers']['analytics{method="test_timed_decorator_labels_method.<locals>.report"}']['count'] == 1
+
+def test_extraction_is_instrumented():
+    metrics.reset()
+    guardian_api = GuardianAPI(rate_limiter=TokenBucket(rate=1e6))
+    with requests_mock.Mocker() as m:
+        m.get("http://content.guardianapis.com/search",
+              json={"response": {"status": "ok", "pages": 1, "results": [{"id": "a", "webTitle": "Justin Trudeau"}]}})
+        guardian_api.results_to_dataframe(guardian_api.guardian_search("Justin Trudeau", "2018-01-01", "2018-12-31"))
+
+    summary = metrics.summary()
+    assert summary['timers']['page_request{status="200"}']['count'] == 1
+    assert summary['counters']['bytes_downloaded'] > 0
+    assert 'extraction{method="GuardianAPI.results_to_dataframe"}' in summary['timers']
+
+def test_profile_hook_writes_stats(tmp_path):
+    with profile(str(tmp_path / "run.prof")):
+        sum(range(1000))
+    assert (tmp_path / "run.prof").stat().st_size > 0
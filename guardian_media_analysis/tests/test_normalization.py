@@ -0,0 +1,48 @@
+import pandas as pd
+from src.storage import flatten_records, normalize_results
+from src.api_extarction import GuardianAPI
+
+RAW_RESULTS = [
+    {"id": "a", "type": "article", "sectionId": "world", "sectionName": "World news", "pillarName": "News",
+     "webPublicationDate": "2019-10-22T06:30:00Z", "webTitle": "Justin Trudeau wins second term", "isHosted": False,
+     "fields": {"headline": "Trudeau wins second term", "byline": "Leyland Cecco", "sectionName": "World news"}},
+    {"id": "b", "type": "liveblog", "sectionId": "world", "sectionName": "World news", "pillarName": "News",
+     "webPublicationDate": "2019-10-23T07:00:00Z", "webTitle": "Canada election live", "isHosted": False,
+     "fields": {"headline": "Canada election: Justin Trudeau live"}},
+    {"id": "c", "type": "article", "sectionId": "sport", "sectionName": "Sport", "pillarName": "Sport",
+     "webPublicationDate": "2019-10-24T08:00:00Z", "webTitle": "Raptors win", "isHosted": False},
+]
+
+def test_fields_are_flattened_and_typed():
+    df = normalize_results(RAW_RESULTS)
+    assert 'fields' not in df.columns
+    assert list(df['headline'].fillna('')) == ["Trudeau wins second term", "Canada election: Justin Trudeau live", ""]
+    assert df.loc[0, 'byline'] == "Leyland Cecco"
+    assert pd.api.types.is_datetime64_dtype(df['webPublicationDate'])
+    assert df.loc[0, 'webPublicationDate'] == pd.Timestamp("2019-10-22 06:30:00")
+    for column in ('type', 'sectionId', 'sectionName', 'pillarName'):
+        assert isinstance(df[column].dtype, pd.CategoricalDtype)
+
+def test_results_to_dataframe_filters_on_title_or_headline():
+    df = GuardianAPI().results_to_dataframe(RAW_RESULTS, filter_query="Justin Trudeau")
+    assert list(df['id']) == ["a", "b"]
+    assert GuardianAPI().results_to_dataframe(RAW_RESULTS, filter_query="nobody") is None
+
+def test_flattened_records_share_the_normalized_columns():
+    flat = flatten_records(RAW_RESULTS)
+    normalized = normalize_results(RAW_RESULTS)
+    assert set(normalized.columns) <= set(flat.columns)
+    assert list(flat['headline']) == ["Trudeau wins second term", "Canada election: Justin Trudeau live", None]
+    assert flat.loc[2, 'byline'] is None
+
+def test_batch_filter_understands_query_operators():
+    guardian_api = GuardianAPI()
+    batch = {query: RAW_RESULTS for query in (
+        '"Justin Trudeau" OR Raptors', 'Trudeau AND (election OR "second term")', 'Trudeau AND NOT hockey', '"Leyland Cecco"')}
+    df = guardian_api.batch_to_dataframe(batch)
+    ids = df.groupby('query', observed=True)['id'].apply(list).to_dict()
+    assert ids == {
+        '"Justin Trudeau" OR Raptors': ["a", "b", "c"],
+        'Trudeau AND (election OR "second term")': ["a", "b"],
+        'Trudeau AND NOT hockey': ["a", "b"],
+    }
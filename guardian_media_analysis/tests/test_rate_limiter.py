@@ -0,0 +1,51 @@
+import time
+import pytest
+import requests_mock
+from src.api_extarction import GuardianAPI, TokenBucket, QuotaExhaustedError, backoff_delay
+
+
+def test_bucket_limits_sustained_rate():
+    limiter = TokenBucket(rate=50, capacity=5)
+    started = time.monotonic()
+    for _ in range(15):
+        limiter.acquire()
+    # 5 burst tokens, then 10 more at 50/s
+    assert time.monotonic() - started >= 0.18
+
+def test_headers_adjust_rate_and_pause_on_exhausted_minute(monkeypatch):
+    limiter = TokenBucket(rate=100)
+    monkeypatch.setattr("src.api_extarction.rate_limiter.time.time", lambda: 1_000_000 * 60 + 59.5)
+    limiter.update_from_headers({'X-RateLimit-Limit-minute': '720', 'X-RateLimit-Remaining-minute': '0'})
+    assert limiter.rate == pytest.approx(12)
+    started = time.monotonic()
+    for _ in range(3):
+        limiter.acquire()
+    # blocked until the minute window resets 0.5 s later, not just one refill interval
+    assert time.monotonic() - started >= 0.45
+
+def test_exhausted_daily_quota_stops_requests():
+    limiter = TokenBucket(rate=100)
+    limiter.update_from_headers({'X-RateLimit-Remaining-day': '0'})
+    with pytest.raises(QuotaExhaustedError):
+        limiter.acquire()
+
+def test_backoff_honours_retry_after_and_jitters():
+    assert backoff_delay(1, retry_after="7") == 7
+    delays = {backoff_delay(3, base_delay=4) for _ in range(20)}
+    assert all(8 <= delay <= 16 for delay in delays)
+    assert len(delays) > 1
+    assert backoff_delay(20, base_delay=5, max_delay=60) <= 60
+
+def test_rate_limited_response_pauses_shared_limiter():
+    limiter = TokenBucket(rate=1000)
+    guardian_api = GuardianAPI(rate_limiter=limiter)
+    responses = [
+        {'status_code': 429, 'headers': {'Retry-After': '0.2'}, 'json': {}},
+        {'status_code': 200, 'json': {"response": {"status": "ok", "pages": 1, "results": [{"id": "a"}]}}},
+    ]
+    with requests_mock.Mocker() as m:
+        m.get("http://content.guardianapis.com/search", responses)
+        started = time.monotonic()
+        articles = guardian_api.guardian_search("Justin Trudeau", "2018-01-01", "2018-12-31")
+    assert articles == [{"id": "a"}]
+    assert time.monotonic() - started >= 0.2
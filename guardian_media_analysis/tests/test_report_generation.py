@@ -0,0 +1,37 @@
+import importlib.util
+import os
+import pytest
+import pandas as pd
+from src.transformation_analysis import DataProcessor, ReportGenerator
+
+
+def test_reports_are_rendered_once_and_skipped_when_unchanged(tmp_path):
+    processor = DataProcessor(pd.DataFrame([
+        {"id": "a", "type": "article", "sectionName": "World news", "webTitle": "Trudeau visits India",
+         "webPublicationDate": "2018-02-21T09:00:00Z"},
+        {"id": "b", "type": "article", "sectionName": "Politics", "webTitle": "Trudeau wins second term",
+         "webPublicationDate": "2019-10-22T06:00:00Z"},
+    ]))
+    generator = ReportGenerator(processor, output_dir=str(tmp_path), formats=('html',), max_workers=2)
+
+    first = generator.generate()
+    assert len(first['rendered']) == 6 and first['skipped'] == []
+    assert os.path.exists(tmp_path / 'articles_by_section.html')
+    assert os.path.exists(tmp_path / 'evolution_of_articles' / 'by_week.html')
+
+    second = generator.generate()
+    assert second['rendered'] == [] and len(second['skipped']) == 6
+
+    os.remove(tmp_path / 'unusual_events_boxplot.html')
+    assert generator.generate()['rendered'] == ['unusual_events_boxplot']
+    processor.close()
+
+def test_unwritable_formats_are_rejected(tmp_path):
+    processor = DataProcessor(pd.DataFrame([{"id": "a", "type": "article", "sectionName": "Politics",
+                                             "webPublicationDate": "2019-10-22T06:00:00Z"}]))
+    with pytest.raises(ValueError):
+        ReportGenerator(processor, output_dir=str(tmp_path), formats=('html', 'gif'))
+    if importlib.util.find_spec('kaleido') is None:
+        with pytest.raises(ValueError, match="kaleido"):
+            ReportGenerator(processor, output_dir=str(tmp_path), formats=('html', 'png'))
+    processor.close()
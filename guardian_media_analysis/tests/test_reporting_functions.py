@@ -0,0 +1,107 @@
+import pandas as pd
+import pytest
+from src.transformation_analysis import DataProcessor, DataVisualizer
+
+
+@pytest.fixture
+def articles_df():
+    return pd.DataFrame([
+        {"id": "a", "type": "article", "sectionName": "World news", "webTitle": "Trudeau visits India",
+         "webUrl": "http://example.com/a", "webPublicationDate": "2018-02-21T09:00:00Z"},
+        {"id": "b", "type": "article", "sectionName": "World news", "webTitle": "Trudeau returns home",
+         "webUrl": "http://example.com/b", "webPublicationDate": "2018-02-21T18:00:00Z"},
+        {"id": "c", "type": "article", "sectionName": "Politics", "webTitle": "Trudeau wins second term",
+         "webUrl": "http://example.com/c", "webPublicationDate": "2019-10-22T06:00:00Z"},
+        {"id": "d", "type": "liveblog", "sectionName": "Politics", "webTitle": "Canada election live",
+         "webUrl": "http://example.com/d", "webPublicationDate": "2019-10-22T07:00:00Z"},
+    ])
+
+@pytest.fixture
+def processor(articles_df):
+    processor = DataProcessor(articles_df)
+    yield processor
+    processor.close()
+
+def test_articles_are_materialized_with_typed_dates(processor):
+    column_types = dict(processor.con.execute("SELECT column_name, column_type FROM (DESCRIBE articles)").fetchall())
+    assert column_types['webPublicationDate'] == 'TIMESTAMP'
+
+def test_articles_count_covers_every_day(processor):
+    article_count, avg_count = processor.get_trudeau_articles_count()
+    counts = article_count.set_index('Date')['No_of_articles']
+    assert counts[pd.Timestamp("2018-01-01")] == 0
+    assert counts[pd.Timestamp("2018-02-21")] == 2
+    assert counts[pd.Timestamp("2019-10-22")] == 1
+    assert counts.sum() == 3
+    assert avg_count == pytest.approx(3 / len(article_count))
+
+def test_top_section_and_total_count(processor):
+    top_sections = processor.get_top_section()
+    assert list(top_sections['sectionName']) == ["World news", "Politics"]
+    assert list(top_sections['section_count']) == [2, 1]
+    assert processor.get_total_article_count() == 2
+
+def test_visualizer_groups_through_shared_connection(processor, monkeypatch):
+    article_count, _ = processor.get_trudeau_articles_count()
+    visualizer = DataVisualizer(processor.df, con=processor.con)
+    monkeypatch.setattr("plotly.graph_objects.Figure.show", lambda self: None)
+    visualizer.plot_article_by_time(article_count, group_by='year')
+
+def test_long_series_are_downsampled_keeping_extremes():
+    counts = pd.Series(1, index=range(5000))
+    counts[1234], counts[4321] = 90, 0
+    article_count = pd.DataFrame({'Date': pd.date_range('2000-01-01', periods=5000, freq='D'), 'No_of_articles': counts})
+    visualizer = DataVisualizer(None)
+
+    bars = visualizer.plot_article_by_time(article_count, group_by='day', show=False, max_points=200).data[0]
+    assert len(bars.x) <= 200
+    assert max(bars.y) == 90 and min(bars.y) == 0
+    assert len(visualizer.plot_article_by_time(article_count, group_by='year', show=False, max_points=200).data[0].x) == 14
+
+    box, outliers = visualizer.plot_unusual_events(article_count, show=False, max_points=200).data
+    assert (box.q1, box.median, box.q3, box.upperfence) == ((1,), (1,), (1,), (1,))
+    assert list(outliers.y) == [90, 0]
+    assert outliers.text[0] == "Date: 2003-05-19<br>Number of Articles: 90"
+
+def test_unusual_event_articles_are_joined_in_one_pass(processor):
+    events = processor.get_articles_unusual_events(["2019-10-22", "2018-02-21", "2020-01-01"])
+    assert [str(date.date()) for date in events['event_date']] == ["2019-10-22", "2018-02-21", "2018-02-21", "2020-01-01"]
+    assert list(events['webTitle'].fillna('')) == [
+        "Trudeau wins second term", "Trudeau visits India", "Trudeau returns home", ""
+    ]
+    assert list(events['article_count']) == [1, 2, 2, 0]
+
+def test_unusual_event_rendering(processor, capsys):
+    processor.render_unusual_events(processor.get_articles_unusual_events(["2018-02-21", "2020-01-01"]))
+    output = capsys.readouterr().out
+    assert "Unusual Event Date: 2018-02-21\nArticle Headlines:\n- Trudeau visits India\n- Trudeau returns home\n" in output
+    assert "Unusual Event Date: 2020-01-01\nArticle Headlines:\nNo articles found for this date.\n" in output
+
+    processor.render_unusual_event_details(processor.get_unusual_event_details(["2019-10-22"]))
+    output = capsys.readouterr().out
+    assert "Event Date: 2019-10-22\nTotal Articles: 1\n" in output
+    assert "Headline: Trudeau wins second term\nSection: Politics\nURL: http://example.com/c\n---" in output
+
+def test_grouped_analytics_by_query(articles_df):
+    tagged = pd.concat([
+        articles_df.assign(query="Justin Trudeau"),
+        articles_df[articles_df['id'] == "c"].assign(query="Jagmeet Singh"),
+    ], ignore_index=True)
+    processor = DataProcessor(tagged)
+
+    counts = processor.get_articles_count_by_query()
+    totals = counts.groupby('query')['No_of_articles'].sum().to_dict()
+    assert totals == {"Jagmeet Singh": 1, "Justin Trudeau": 3}
+    assert counts.groupby('query').size().nunique() == 1
+
+    sections = processor.get_top_section_by_query()
+    top = sections[sections['section_rank'] == 1].set_index('query')['sectionName'].to_dict()
+    assert top == {"Jagmeet Singh": "Politics", "Justin Trudeau": "World news"}
+
+    events = processor.get_unusual_events_by_query(counts)
+    assert set(events['query']) == {"Jagmeet Singh", "Justin Trudeau"}
+    assert pd.Timestamp("2019-10-22") in list(events.loc[events['query'] == "Jagmeet Singh", 'Date'])
+    for query, query_events in events.groupby('query'):
+        expected = processor.get_unusual_events(counts[counts['query'] == query].drop(columns='query'))
+        assert list(query_events['Date']) == list(expected['Date'])
+        assert query_events['score'].to_numpy() == pytest.approx(expected['score'].to_numpy())
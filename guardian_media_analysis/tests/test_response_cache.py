@@ -0,0 +1,67 @@
+import json
+import os
+import time
+import pytest
+import requests_mock
+from src.api_extarction import GuardianAPI, ResponseCache, CacheMissError
+
+URL = "http://content.guardianapis.com/search"
+MOCK_PAGE = {"response": {"status": "ok", "pages": 1, "results": [{"id": "a", "webTitle": "Justin Trudeau"}]}}
+
+
+def test_key_ignores_api_key(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    assert cache.key(URL, {'q': 'x', 'api-key': 'one'}) == cache.key(URL, {'q': 'x', 'api-key': 'two'})
+    assert cache.key(URL, {'q': 'x', 'page': 1}) != cache.key(URL, {'q': 'x', 'page': 2})
+
+def test_expired_entries_are_not_served(tmp_path):
+    cache = ResponseCache(str(tmp_path), ttl=60)
+    cache.set(URL, {'page': 1}, MOCK_PAGE)
+    assert cache.get(URL, {'page': 1}) == MOCK_PAGE
+    cache.ttl = -1
+    assert cache.get(URL, {'page': 1}) is None
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    for page in range(3):
+        cache.set(URL, {'page': page}, MOCK_PAGE)
+        path = os.path.join(str(tmp_path), f"{cache.key(URL, {'page': page})}.json")
+        os.utime(path, (time.time() - 100 + page, time.time() - 100 + page))
+    cache.get(URL, {'page': 0})
+    cache.max_bytes = int(2.5 * os.path.getsize(path))
+    cache.set(URL, {'page': 3}, MOCK_PAGE)
+    assert cache.get(URL, {'page': 1}) is None
+    assert cache.get(URL, {'page': 0}) == MOCK_PAGE
+    assert cache.get(URL, {'page': 3}) == MOCK_PAGE
+
+def test_offline_mode_serves_from_cache(tmp_path):
+    guardian_api = GuardianAPI(cache=ResponseCache(str(tmp_path)))
+    with requests_mock.Mocker() as m:
+        m.get(URL, json=MOCK_PAGE)
+        online = guardian_api.guardian_search("Justin Trudeau", "2018-01-01", "2018-12-31")
+
+    guardian_api.cache.offline = True
+    with requests_mock.Mocker() as m:
+        assert guardian_api.guardian_search("Justin Trudeau", "2018-01-01", "2018-12-31") == online
+        assert not m.called
+        with pytest.raises(CacheMissError):
+            guardian_api.guardian_search("Justin Trudeau", "2019-01-01", "2019-12-31")
+
+def test_offline_mode_serves_expired_entries(tmp_path):
+    guardian_api = GuardianAPI(cache=ResponseCache(str(tmp_path), ttl=60))
+    with requests_mock.Mocker() as m:
+        m.get(URL, json=MOCK_PAGE)
+        online = guardian_api.guardian_search("Justin Trudeau", "2018-01-01", "2018-12-31")
+
+    for name in os.listdir(str(tmp_path)):
+        path = os.path.join(str(tmp_path), name)
+        with open(path) as file:
+            entry = json.load(file)
+        entry['stored_at'] -= 2 * 24 * 60 * 60
+        with open(path, "w") as file:
+            json.dump(entry, file)
+
+    guardian_api.cache.offline = True
+    for _ in range(2):
+        assert guardian_api.guardian_search("Justin Trudeau", "2018-01-01", "2018-12-31") == online
+    assert len(os.listdir(str(tmp_path))) == 1
@@ -0,0 +1,62 @@
+import pytest
+import requests_mock
+from src.api_extarction import GuardianAPI, SearchQuery, TokenBucket
+
+
+def test_query_builder_params():
+    query = (SearchQuery('"Justin Trudeau"')
+             .in_fields('headline', 'standfirst')
+             .in_section('world', 'politics')
+             .with_tag('world/canada')
+             .ordered_by('newest')
+             .with_fields('headline', 'byline'))
+    assert query.to_params("2018-01-01", "2018-12-31") == {
+        'from-date': "2018-01-01",
+        'to-date': "2018-12-31",
+        'page-size': 100,
+        'q': '"Justin Trudeau"',
+        'query-fields': 'headline,standfirst',
+        'section': 'world|politics',
+        'tag': 'world/canada',
+        'order-by': 'newest',
+        'show-fields': 'headline,byline',
+    }
+    assert str(query) == ('"Justin Trudeau" [query-fields=headline,standfirst, section=world|politics, tag=world/canada, '
+                          'order-by=newest, show-fields=headline,byline]')
+
+def test_builders_return_new_queries_with_distinct_state_keys():
+    base = SearchQuery('Trudeau')
+    newest, oldest = base.ordered_by('newest'), base.ordered_by('oldest')
+    assert base.order_by is None
+    keys = {query.state_key() for query in (base, newest, oldest, base.with_fields('headline'),
+                                            SearchQuery('Trudeau', page_size=50))}
+    assert len(keys) == 5
+    assert base.state_key() == SearchQuery('Trudeau').state_key()
+    assert base.state_key().startswith('trudeau_')
+    assert str(newest) != str(oldest)
+
+def test_invalid_order_is_rejected():
+    with pytest.raises(ValueError):
+        SearchQuery("Justin Trudeau").ordered_by("popular")
+
+def test_search_sends_server_side_filters():
+    guardian_api = GuardianAPI(rate_limiter=TokenBucket(rate=1e6))
+    query = SearchQuery("Justin Trudeau", query_fields=['headline'], sections=['world'], show_fields=['headline'])
+    with requests_mock.Mocker() as m:
+        m.get("http://content.guardianapis.com/search", json={"response": {"status": "ok", "pages": 1, "results": []}})
+        guardian_api.guardian_search(query, "2018-01-01", "2018-12-31")
+        guardian_api.guardian_search("Justin Trudeau", "2018-01-01", "2018-12-31")
+        filtered, plain = m.request_history
+
+    assert filtered.qs['query-fields'] == ['headline']
+    assert filtered.qs['section'] == ['world']
+    assert filtered.qs['show-fields'] == ['headline']
+    assert plain.qs['q'] == ['justin trudeau']
+    assert plain.qs['show-fields'] == ['headline,byline,sectionname,webpublicationdate']
+
+def test_search_query_results_are_not_filtered_again():
+    guardian_api = GuardianAPI(rate_limiter=TokenBucket(rate=1e6))
+    results = [{"id": "a", "type": "article", "webTitle": "Justin Trudeau wins", "webPublicationDate": "2019-10-22T06:00:00Z"},
+               {"id": "b", "type": "article", "webTitle": "Canada votes", "webPublicationDate": "2019-10-22T07:00:00Z"}]
+    df = guardian_api.batch_to_dataframe({SearchQuery('"Justin Trudeau"').in_fields('body'): results})
+    assert list(df['id']) == ["a", "b"]